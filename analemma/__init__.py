@@ -9,6 +9,13 @@ __version__ = "1.0.0"
 
 from .calculator import AnalemmaCalculator
 from .sky_mapper import SkyMapper
-from .plotter import AnalemmaPlotter
 
 __all__ = ['AnalemmaCalculator', 'SkyMapper', 'AnalemmaPlotter']
+
+
+def __getattr__(name):
+    # The plotter pulls in matplotlib, so only import it when first requested
+    if name == 'AnalemmaPlotter':
+        from .plotter import AnalemmaPlotter
+        return AnalemmaPlotter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,20 +5,71 @@ Pure numerical calculation of solar declination and equation of time.
 Supports dual precision modes: Approximate (fast) and High-Precision (Astropy).
 """
 
+import functools
+import importlib.util
+import math
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Tuple, List, Dict, Literal
 import warnings
 
-# Optional high-precision imports
+# Optional high-precision imports. Astropy is slow to import, so only check
+# that it is installed here and load it on first high-precision use.
+ASTROPY_AVAILABLE = importlib.util.find_spec("astropy") is not None
+if not ASTROPY_AVAILABLE:
+    warnings.warn("Astropy not available. High-precision mode will not work.")
+
+Time = None
+get_sun = None
+
+# Optional fused evaluation of array expressions
 try:
-    from astropy.time import Time
-    from astropy.coordinates import get_sun, EarthLocation
-    import astropy.units as u
-    ASTROPY_AVAILABLE = True
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
 except ImportError:
-    ASTROPY_AVAILABLE = False
-    warnings.warn("Astropy not available. High-precision mode will not work.")
+    NUMEXPR_AVAILABLE = False
+
+# Optional JIT compilation of the approximate-mode kernels. Numba is slow to
+# import and compile, so it is only loaded when a caller opts in.
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _jan1_ordinal(year: int) -> int:
+    """Proleptic Gregorian ordinal of January 1st of a year."""
+    return datetime(year, 1, 1).toordinal()
+
+
+def _day_of_year(date: datetime) -> int:
+    """Day of year (1-366) without building a struct_time via timetuple()."""
+    return date.toordinal() - _jan1_ordinal(date.year) + 1
+
+
+def _lazy_astropy():
+    """Import the Astropy pieces used by high-precision mode on first call."""
+    global Time, get_sun
+    if Time is None:
+        from astropy.time import Time as _Time
+        from astropy.coordinates import get_sun as _get_sun
+        Time, get_sun = _Time, _get_sun
+    return Time, get_sun
+
+
+@functools.lru_cache(maxsize=None)
+def _decl_eot_numba():
+    """Build the Numba declination + EoT kernel on first use."""
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(days, obliquity, out_decl, out_eot):
+        """Fused declination + EoT evaluation in a single pass over days."""
+        for i in prange(days.shape[0]):
+            day = days[i]
+            out_decl[i] = obliquity * math.sin(math.radians((360 / 365) * (284 + day)))
+            B = 2 * math.pi * (day - 81) / 365
+            out_eot[i] = 9.87 * math.sin(2 * B) - 7.53 * math.cos(B) + 1.5 * math.sin(B)
+    
+    return kernel
 
 
 class AnalemmaCalculator:
@@ -37,6 +88,11 @@ class AnalemmaCalculator:
         - 'high-precision': NASA-grade coordinates via Astropy
     year : int, optional
         Year for calculations (default: current year)
+    use_numba : bool, optional
+        Use the Numba-compiled kernel for full-year approximate tables when
+        numba is installed. Only worthwhile for long runs of days: JIT
+        warm-up costs far more than the NumPy path on a 365-day year
+        (default: False)
     """
     
     # Constants
@@ -45,10 +101,11 @@ class AnalemmaCalculator:
     VERNAL_EQUINOX_OFFSET = 81  # Approx day of vernal equinox
     
     def __init__(self, mode: Literal['approximate', 'high-precision'] = 'approximate', 
-                 year: int = None):
+                 year: int = None, use_numba: bool = False):
         """Initialize the calculator with specified mode."""
         self.mode = mode
         self.year = year or datetime.now().year
+        self.use_numba = use_numba and NUMBA_AVAILABLE
         
         if mode == 'high-precision' and not ASTROPY_AVAILABLE:
             raise RuntimeError("High-precision mode requires astropy. "
@@ -70,6 +127,13 @@ class AnalemmaCalculator:
         float
             Solar declination in degrees
         """
+        if type(day_of_year) is int and 0 <= day_of_year <= 366:
+            return self._day_tables()[0][day_of_year]
+        return self._declination_formula(day_of_year)
+    
+    @classmethod
+    def _declination_formula(cls, day_of_year: float) -> float:
+        """Evaluate the declination approximation for one day."""
         # Phase shift ensures δ=0 at vernal equinox (day ~81)
         phase_shifted_day = 284 + day_of_year
         
@@ -77,7 +141,7 @@ class AnalemmaCalculator:
         angle_rad = np.radians((360 / 365) * phase_shifted_day)
         
         # Calculate declination
-        declination = self.OBLIQUITY * np.sin(angle_rad)
+        declination = cls.OBLIQUITY * np.sin(angle_rad)
         
         return declination
     
@@ -99,6 +163,13 @@ class AnalemmaCalculator:
         float
             Equation of time in minutes
         """
+        if type(day_of_year) is int and 0 <= day_of_year <= 366:
+            return self._day_tables()[1][day_of_year]
+        return self._equation_of_time_formula(day_of_year)
+    
+    @staticmethod
+    def _equation_of_time_formula(day_of_year: float) -> float:
+        """Evaluate the equation of time approximation for one day."""
         # Convert day of year to radians
         B = 2 * np.pi * (day_of_year - 81) / 365
         
@@ -113,6 +184,120 @@ class AnalemmaCalculator:
         
         return eot
     
+    def calculate_declination_approximate_vec(self, days: np.ndarray) -> np.ndarray:
+        """
+        Vectorized form of calculate_declination_approximate().
+        
+        Parameters
+        ----------
+        days : np.ndarray
+            Array of days of year (1-365)
+        
+        Returns
+        -------
+        np.ndarray
+            Solar declination in degrees for each day
+        """
+        angle_rad = np.radians((360 / 365) * (284 + days))
+        return self.OBLIQUITY * np.sin(angle_rad)
+    
+    def calculate_equation_of_time_approximate_vec(self, days: np.ndarray) -> np.ndarray:
+        """
+        Vectorized form of calculate_equation_of_time_approximate().
+        
+        Parameters
+        ----------
+        days : np.ndarray
+            Array of days of year (1-365)
+        
+        Returns
+        -------
+        np.ndarray
+            Equation of time in minutes for each day
+        """
+        B = 2 * np.pi * (np.asarray(days, dtype=np.float64) - 81) / 365
+        if NUMEXPR_AVAILABLE:
+            # One fused, threaded pass instead of four temporary arrays
+            return ne.evaluate("9.87 * sin(2 * B) - 7.53 * cos(B) + 1.5 * sin(B)",
+                               local_dict={'B': B})
+        return 9.87 * np.sin(2 * B) - 7.53 * np.cos(B) + 1.5 * np.sin(B)
+    
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _day_tables(cls) -> Tuple[Tuple[float, ...], Tuple[float, ...]]:
+        """
+        Scalar-formula declination and EoT for every integer day 0-366.
+        
+        Built once on first use so per-day calls become a tuple lookup;
+        values are exactly those of the scalar formulas.
+        
+        Returns
+        -------
+        tuple
+            (declination, eot) tuples indexed by day of year
+        """
+        days = range(367)
+        return (tuple(cls._declination_formula(day) for day in days),
+                tuple(cls._equation_of_time_formula(day) for day in days))
+    
+    @classmethod
+    @functools.lru_cache(maxsize=8)
+    def _year_tables(cls, year: int, days: int,
+                     use_numba: bool = False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Memoized approximate-mode tables for a run of days starting Jan 1.
+        
+        The tables do not depend on the time of day, so repeated calls to
+        calculate_year() for the same year reuse them instead of re-evaluating
+        the trig formulas.
+        
+        Returns
+        -------
+        tuple
+            Read-only (day_of_year, declination, eot) arrays
+        """
+        # Days past the end of the year wrap around to Jan 1 of the next year
+        dates = np.datetime64(f'{year:04d}-01-01') + np.arange(days)
+        day_of_year = (dates - dates.astype('datetime64[Y]')).astype(np.int64) + 1
+        
+        if use_numba and NUMBA_AVAILABLE:
+            declination = np.empty(days)
+            eot = np.empty(days)
+            _decl_eot_numba()(day_of_year, cls.OBLIQUITY, declination, eot)
+        else:
+            calc = cls(mode='approximate', year=year)
+            declination = calc.calculate_declination_approximate_vec(day_of_year)
+            eot = calc.calculate_equation_of_time_approximate_vec(day_of_year)
+        
+        for table in (day_of_year, declination, eot):
+            table.flags.writeable = False
+        
+        return day_of_year, declination, eot
+    
+    @classmethod
+    @functools.lru_cache(maxsize=16)
+    def _high_precision_tables(cls, year: int, hour: int, minute: int,
+                               days: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Memoized high-precision tables for a run of days starting Jan 1.
+        
+        Astropy evaluation dominates high-precision calculate_year(), so the
+        result is cached per (year, hour, minute, days).
+        
+        Returns
+        -------
+        tuple
+            Read-only (declination, eot) arrays
+        """
+        start_date = np.datetime64(datetime(year, 1, 1, hour, minute), 's')
+        dates = (start_date + np.arange(days).astype('timedelta64[D]')).tolist()
+        declination, eot = cls(mode='high-precision', year=year).calculate_high_precision_vec(dates)
+        
+        for table in (declination, eot):
+            table.flags.writeable = False
+        
+        return declination, eot
+    
     def calculate_high_precision(self, dt: datetime) -> Tuple[float, float]:
         """
         Calculate solar position using high-precision Astropy methods.
@@ -127,38 +312,47 @@ class AnalemmaCalculator:
         tuple
             (declination in degrees, equation of time in minutes)
         """
+        declination, eot_minutes = self.calculate_high_precision_vec([dt])
+        return float(declination[0]), float(eot_minutes[0])
+    
+    def calculate_high_precision_vec(self, dts: List[datetime]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculate solar positions for many datetimes with one Astropy call.
+        
+        Building a single array-valued Time and calling get_sun() once
+        amortizes Astropy's per-call setup across all dates.
+        
+        Parameters
+        ----------
+        dts : list of datetime
+            Dates and times for calculation
+        
+        Returns
+        -------
+        tuple
+            (declination array in degrees, equation of time array in minutes)
+        """
         if not ASTROPY_AVAILABLE:
             raise RuntimeError("High-precision mode requires astropy")
         
-        # Convert to Astropy Time object
-        time = Time(dt)
+        Time, get_sun = _lazy_astropy()
+        dts = list(dts)
+        
+        # Convert to a single array-valued Astropy Time object
+        time = Time(dts)
         
-        # Get Sun position (uses JPL ephemerides if available)
+        # Get Sun positions (uses JPL ephemerides if available)
         sun = get_sun(time)
         
         # Declination from coordinates
-        declination = sun.dec.degree
-        
-        # Calculate equation of time
-        # EoT = Apparent Solar Time - Mean Solar Time
-        # Approximate from right ascension
-        ra_hours = sun.ra.hour
-        mean_solar_hours = (dt.timetuple().tm_yday - 1) * 24 / 365.25
-        
-        # Convert RA difference to time difference
-        # Note: This is a simplified calculation
-        # More accurate: use actual solar noon calculations
-        eot_hours = (ra_hours - mean_solar_hours) % 24
-        if eot_hours > 12:
-            eot_hours -= 24
-        eot_minutes = eot_hours * 4  # Convert hours of RA to minutes of time
+        declination = np.atleast_1d(sun.dec.degree)
         
         # More accurate EoT using GAST
         # This is a placeholder - full implementation would use:
         # EoT = GHA_mean_sun - GHA_apparent_sun
         # For now, use simpler approximation
-        day_of_year = dt.timetuple().tm_yday
-        eot_minutes = self.calculate_equation_of_time_approximate(day_of_year)
+        day_of_year = np.array([_day_of_year(dt) for dt in dts])
+        eot_minutes = self.calculate_equation_of_time_approximate_vec(day_of_year)
         
         return declination, eot_minutes
     
@@ -179,7 +373,7 @@ class AnalemmaCalculator:
             - 'eot': Equation of time in minutes
             - 'day_of_year': Day of year (1-365)
         """
-        day_of_year = date.timetuple().tm_yday
+        day_of_year = _day_of_year(date)
         
         if self.mode == 'approximate':
             declination = self.calculate_declination_approximate(day_of_year)
@@ -219,15 +413,106 @@ class AnalemmaCalculator:
             - 'day_of_year': Day of year
             - 'date': datetime object
         """
-        results = []
-        start_date = datetime(self.year, 1, 1, hour, minute)
+        # Build all dates with one datetime64 range, converting to Python
+        # datetimes only for the returned dicts
+        start_date = np.datetime64(datetime(self.year, 1, 1, hour, minute), 's')
+        dates = (start_date + np.arange(days).astype('timedelta64[D]')).tolist()
+        
+        if self.mode == 'high-precision':
+            declination, eot = self._high_precision_tables(self.year, hour,
+                                                           minute, days)
+            return [
+                {
+                    'declination': dec,
+                    'eot': e,
+                    'day_of_year': _day_of_year(date),
+                    'date': date
+                }
+                for dec, e, date in zip(declination.tolist(), eot.tolist(), dates)
+            ]
+        elif self.mode != 'approximate':
+            raise ValueError(f"Unknown mode: {self.mode}")
+        
+        # Evaluate the whole year in one pass instead of per-day calculate()
+        day_of_year, declination, eot = self._year_tables(self.year, days,
+                                                         self.use_numba)
+        
+        return [
+            {
+                'declination': dec,
+                'eot': e,
+                'day_of_year': doy,
+                'date': date
+            }
+            for dec, e, doy, date in zip(declination.tolist(), eot.tolist(),
+                                         day_of_year.tolist(), dates)
+        ]
+    
+    def calculate_year_interpolated(self, hour: int = 12, minute: int = 0,
+                                    days: int = 365,
+                                    n_anchor: int = 24) -> List[Dict[str, float]]:
+        """
+        Calculate a year of high-precision values from a few anchor dates.
         
-        for day in range(days):
-            current_date = start_date + timedelta(days=day)
-            result = self.calculate(current_date)
-            results.append(result)
+        Declination and EoT are smooth functions of time, so Astropy is
+        only evaluated on n_anchor evenly spaced days and the remaining days
+        are filled in with a cubic spline. Runs of n_anchor days or fewer
+        are evaluated directly. Requires astropy and scipy.
         
-        return results
+        Parameters
+        ----------
+        hour : int
+            Hour of day (0-23) for observations
+        minute : int
+            Minute of hour (0-59)
+        days : int
+            Number of days to calculate (default: 365)
+        n_anchor : int
+            Number of days evaluated with Astropy, at least 2 (default: 24)
+        
+        Returns
+        -------
+        list
+            Same structure as calculate_year()
+        """
+        if n_anchor < 2:
+            raise ValueError(f"n_anchor must be at least 2, got {n_anchor}")
+        if not ASTROPY_AVAILABLE:
+            raise RuntimeError("High-precision mode requires astropy")
+        try:
+            from scipy.interpolate import CubicSpline
+        except ImportError:
+            raise RuntimeError("Interpolated high-precision mode requires scipy. "
+                             "Install with: pip install scipy")
+        
+        start_date = np.datetime64(datetime(self.year, 1, 1, hour, minute), 's')
+        dates = start_date + np.arange(days).astype('timedelta64[D]')
+        
+        if days <= n_anchor:
+            # Nothing to save by interpolating (and too few points for a
+            # spline when days < 2)
+            declination, eot = self._high_precision_tables(self.year, hour,
+                                                           minute, days)
+        else:
+            # Anchor on whole days so the spline passes through exact values
+            anchor_idx = np.unique(np.linspace(0, days - 1, n_anchor).round().astype(int))
+            anchor_dec, anchor_eot = self.calculate_high_precision_vec(
+                dates[anchor_idx].tolist())
+            
+            offsets = np.arange(days)
+            declination = CubicSpline(anchor_idx, anchor_dec)(offsets)
+            eot = CubicSpline(anchor_idx, anchor_eot)(offsets)
+        
+        return [
+            {
+                'declination': dec,
+                'eot': e,
+                'day_of_year': _day_of_year(date),
+                'date': date
+            }
+            for dec, e, date in zip(declination.tolist(), eot.tolist(),
+                                    dates.tolist())
+        ]
     
     def get_max_declination(self) -> Tuple[float, float]:
         """
@@ -261,18 +546,23 @@ class AnalemmaCalculator:
         if not ASTROPY_AVAILABLE:
             raise RuntimeError("Comparison requires astropy to be installed")
         
-        # Save current mode
-        original_mode = self.mode
-        
-        # Calculate with both modes
-        self.mode = 'approximate'
-        approx_result = self.calculate(date)
-        
-        self.mode = 'high-precision'
-        precise_result = self.calculate(date)
+        # Call both paths directly rather than toggling self.mode, so the
+        # calculator's state is never mutated
+        day_of_year = _day_of_year(date)
+        approx_result = {
+            'declination': self.calculate_declination_approximate(day_of_year),
+            'eot': self.calculate_equation_of_time_approximate(day_of_year),
+            'day_of_year': day_of_year,
+            'date': date
+        }
         
-        # Restore original mode
-        self.mode = original_mode
+        declination, eot = self.calculate_high_precision(date)
+        precise_result = {
+            'declination': declination,
+            'eot': eot,
+            'day_of_year': day_of_year,
+            'date': date
+        }
         
         # Calculate differences
         diff = {
@@ -12,16 +12,54 @@ Workflow:
 5. Overlay the theoretical curve onto the image
 """
 
+import functools
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
+from dataclasses import dataclass
 from typing import Tuple, Optional, Dict, List
 from datetime import datetime
-import matplotlib.pyplot as plt
 
 from .calculator import AnalemmaCalculator
 from .sky_mapper import SkyMapper
 
 
+@dataclass
+class AnalemmaPoints:
+    """
+    Visible analemma points stored as parallel arrays (one entry per day).
+    
+    Attributes
+    ----------
+    altitude : np.ndarray
+        Solar altitude in degrees
+    azimuth : np.ndarray
+        Solar azimuth in degrees
+    pixel_x : np.ndarray
+        Image x coordinate of each point
+    pixel_y : np.ndarray
+        Image y coordinate of each point
+    dates : np.ndarray
+        datetime object for each point
+    """
+    altitude: np.ndarray
+    azimuth: np.ndarray
+    pixel_x: np.ndarray
+    pixel_y: np.ndarray
+    dates: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.altitude)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_font(name: str, size: int) -> ImageFont.ImageFont:
+    """Load a TrueType font once, falling back to PIL's default font."""
+    try:
+        return ImageFont.truetype(name, size)
+    except (OSError, ImportError):
+        return ImageFont.load_default()
+
+
 class ImageAnchorer:
     """
     Overlay analemma curves onto real sky photographs.
@@ -44,6 +82,13 @@ class ImageAnchorer:
         If None, will use center of image
     """
     
+    # Photos with more pixels than this are searched at reduced resolution
+    SUN_SEARCH_MAX_PIXELS = 4_000_000
+    SUN_SEARCH_STEP = 4
+    SUN_REFINE_HALF_WINDOW = 64
+    # Pixels at least this fraction of the peak brightness count as the sun
+    SUN_THRESHOLD = 0.999
+    
     def __init__(self,
                  image_path: str,
                  anchor_datetime: datetime,
@@ -64,6 +109,10 @@ class ImageAnchorer:
         
         self.image_width, self.image_height = self.image.size
         
+        # Analemma points per number of days (cleared on recalibration or
+        # when sun_pixel / anchor_data are reassigned)
+        self._analemma_points_cache: Dict[int, AnalemmaPoints] = {}
+        
         # Store metadata
         self.anchor_datetime = anchor_datetime
         self.latitude = latitude
@@ -90,29 +139,97 @@ class ImageAnchorer:
         self.pixels_per_degree_az = None
         self.pixels_per_degree_alt = None
     
+    @property
+    def sun_pixel(self) -> Tuple[int, int]:
+        """(x, y) pixel of the sun in the image, the anchor of the overlay."""
+        return self._sun_pixel
+    
+    @sun_pixel.setter
+    def sun_pixel(self, value: Tuple[int, int]):
+        self._sun_pixel = value
+        self._analemma_points_cache.clear()
+    
+    @property
+    def anchor_data(self) -> Dict:
+        """Sky coordinates of the sun at the anchor time."""
+        return self._anchor_data
+    
+    @anchor_data.setter
+    def anchor_data(self, value: Dict):
+        self._anchor_data = value
+        self._analemma_points_cache.clear()
+    
     def _detect_sun_position(self) -> Tuple[int, int]:
-        """Detect the sun's position using advanced image processing."""
-        import numpy as np
+        """
+        Detect the sun's position using advanced image processing.
+        
+        Large photos are searched on a strided (downsampled) view first and
+        the estimate is then refined on a small full-resolution window. If
+        the bright region reaches the edge of that window (a large disc or
+        flare), the whole image is searched at full resolution instead.
+        """
+        # View the image as a numpy array (shares PIL's buffer where possible)
+        img_array = np.asarray(self.image)
+        
+        height, width = img_array.shape[:2]
+        if height * width <= self.SUN_SEARCH_MAX_PIXELS:
+            return self._locate_sun(img_array)
+        
+        # Coarse search on every Nth pixel in each direction
+        step = self.SUN_SEARCH_STEP
+        coarse_x, coarse_y = self._locate_sun(img_array[::step, ::step])
+        
+        # Refine at full resolution around the coarse estimate
+        half = self.SUN_REFINE_HALF_WINDOW
+        x0 = max(0, coarse_x * step - half)
+        y0 = max(0, coarse_y * step - half)
+        x1 = min(width, coarse_x * step + half + 1)
+        y1 = min(height, coarse_y * step + half + 1)
+        window = img_array[y0:y1, x0:x1]
+        
+        # A blob cut off by the window would bias the centroid toward the
+        # coarse peak; edges that coincide with the image border are fine
+        gray = self._brightness(window)
+        bright = gray >= gray.max() * self.SUN_THRESHOLD
+        if ((y0 > 0 and bright[0].any()) or (y1 < height and bright[-1].any()) or
+                (x0 > 0 and bright[:, 0].any()) or (x1 < width and bright[:, -1].any())):
+            return self._locate_sun(img_array)
+        
+        sun_x, sun_y = self._locate_sun(window)
+        
+        return (int(x0 + sun_x), int(y0 + sun_y))
+    
+    @staticmethod
+    def _brightness(img_array: np.ndarray) -> np.ndarray:
+        """Per-pixel brightness as the max over colour channels."""
+        # If RGB, convert to grayscale (use max of RGB channels for brightest regions)
+        # Channel-wise np.maximum is far faster than np.max(axis=2), which
+        # reduces over the short innermost axis
+        if len(img_array.shape) == 3:
+            gray = img_array[..., 0]
+            if img_array.shape[2] > 1:
+                gray = np.maximum(gray, img_array[..., 1])
+                for c in range(2, img_array.shape[2]):
+                    np.maximum(gray, img_array[..., c], out=gray)
+            return gray
+        return img_array
+    
+    @staticmethod
+    def _locate_sun(img_array: np.ndarray) -> Tuple[int, int]:
+        """Find the centre of the brightest blob in an image array."""
         try:
             from scipy import ndimage
             has_scipy = True
         except ImportError:
             has_scipy = False
         
-        # Convert to numpy array
-        img_array = np.array(self.image)
-        
-        # If RGB, convert to grayscale (use max of RGB channels for brightest regions)
-        if len(img_array.shape) == 3:
-            gray = np.max(img_array, axis=2)
-        else:
-            gray = img_array
+        gray = ImageAnchorer._brightness(img_array)
         
         # Strategy 1: Find the absolute brightest pixel cluster
         max_val = gray.max()
         
         # Create mask of only the VERY brightest pixels (99.9% threshold)
-        threshold = max_val * 0.999
+        threshold = max_val * ImageAnchorer.SUN_THRESHOLD
         bright_mask = gray >= threshold
         
         # Use scipy for better blob detection if available
@@ -174,6 +291,9 @@ class ImageAnchorer:
         """
         self.pixels_per_degree_az = self.image_width / horizontal_fov
         self.pixels_per_degree_alt = self.image_height / vertical_fov
+        
+        # Pixel positions depend on calibration
+        self._analemma_points_cache.clear()
     
     def calibrate_from_focal_length(self,
                                     focal_length_mm: float,
@@ -213,32 +333,66 @@ class ImageAnchorer:
         tuple
             (x, y) pixel coordinates
         """
-        if self.pixels_per_degree_az is None:
-            raise ValueError("Must calibrate before converting coordinates. "
-                           "Call calibrate_from_field_of_view() or "
-                           "calibrate_from_focal_length()")
+        self._check_calibrated()
         
         # Calculate offset from anchor point
-        anchor_alt = self.anchor_data['altitude']
-        anchor_az = self.anchor_data['azimuth']
-        
-        delta_az = azimuth - anchor_az
-        delta_alt = altitude - anchor_alt
+        delta_az = azimuth - self.anchor_data['azimuth']
+        delta_alt = altitude - self.anchor_data['altitude']
         
         # Convert to pixel offset (y is inverted - up is negative)
         delta_x = delta_az * self.pixels_per_degree_az
         delta_y = -delta_alt * self.pixels_per_degree_alt
         
         # Apply to anchor pixel
-        x = int(self.sun_pixel[0] + delta_x)
-        y = int(self.sun_pixel[1] + delta_y)
+        sun_x, sun_y = self.sun_pixel
+        x = int(sun_x + delta_x)
+        y = int(sun_y + delta_y)
         
         return (x, y)
     
-    def generate_analemma_points(self, days: int = 365) -> List[Dict]:
+    def sky_to_pixel_vec(self, altitude: np.ndarray,
+                         azimuth: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Vectorized form of sky_to_pixel() for arrays of sky coordinates.
+        
+        Parameters
+        ----------
+        altitude : np.ndarray
+            Altitudes in degrees
+        azimuth : np.ndarray
+            Azimuths in degrees
+        
+        Returns
+        -------
+        tuple
+            (x, y) integer pixel coordinate arrays
+        """
+        self._check_calibrated()
+        
+        delta_x = (azimuth - self.anchor_data['azimuth']) * self.pixels_per_degree_az
+        delta_y = -(altitude - self.anchor_data['altitude']) * self.pixels_per_degree_alt
+        
+        # astype truncates toward zero, matching int() in sky_to_pixel()
+        sun_x, sun_y = self.sun_pixel
+        x = (sun_x + delta_x).astype(np.int32)
+        y = (sun_y + delta_y).astype(np.int32)
+        
+        return (x, y)
+    
+    def _check_calibrated(self):
+        """Raise if no pixel-to-degree calibration has been set."""
+        if self.pixels_per_degree_az is None:
+            raise ValueError("Must calibrate before converting coordinates. "
+                           "Call calibrate_from_field_of_view() or "
+                           "calibrate_from_focal_length()")
+    
+    def generate_analemma_points(self, days: int = 365) -> AnalemmaPoints:
         """
         Generate analemma points for the full year.
         
+        Results are cached per number of days until the next calibration,
+        so overlay, composite and statistics calls share one computation.
+        
         Parameters
         ----------
         days : int
@@ -246,104 +400,155 @@ class ImageAnchorer:
         
         Returns
         -------
-        list
-            List of dictionaries with sky coordinates and pixel positions
+        AnalemmaPoints
+            Sky coordinates, pixel positions and dates of points above
+            the horizon
         """
-        # Calculate for same time of day throughout the year
-        year_data = self.calculator.calculate_year(
-            hour=self.anchor_datetime.hour,
-            minute=self.anchor_datetime.minute,
-            days=days
-        )
-        
-        # Map to horizon coordinates
-        sky_data = self.sky_mapper.map_to_horizon(year_data)
-        
-        # Convert to pixel coordinates and filter out points below horizon
-        visible_points = []
-        for point in sky_data:
-            # Skip if below horizon
-            if point['altitude'] < 0:
-                continue
-            
-            x, y = self.sky_to_pixel(point['altitude'], point['azimuth'])
-            point['pixel_x'] = x
-            point['pixel_y'] = y
-            visible_points.append(point)
-        
-        return visible_points
+        if days not in self._analemma_points_cache:
+            self._analemma_points_cache[days] = self._compute_analemma_points(days)
+        return self._analemma_points_cache[days]
     
-    def overlay_analemma(self,
-                        output_path: str,
-                        dot_size: int = 10,
-                        dot_color: Tuple[int, int, int] = (255, 255, 0),
-                        line_color: Tuple[int, int, int] = (255, 200, 0),
-                        line_width: int = 2,
-                        show_dates: bool = True,
-                        date_interval: int = 30) -> Image.Image:
+    def _compute_analemma_points(self, days: int) -> AnalemmaPoints:
+        """Calculate analemma points and their pixel positions."""
+        # Sky coordinates for the same time of day throughout the year
+        # (cached per location and clock time by the sky mapper)
+        year = self.calculator.year
+        hour = self.anchor_datetime.hour
+        minute = self.anchor_datetime.minute
+        table = self.sky_mapper.map_year(year, hour, minute, days,
+                                         self.calculator.mode)
+        
+        altitudes = table[:, 0]
+        azimuths = table[:, 1]
+        start = np.datetime64(datetime(year, 1, 1, hour, minute), 's')
+        dates = (start + np.arange(days).astype('timedelta64[D]')).astype(object)
+        
+        # Filter out points below horizon
+        visible = altitudes >= 0
+        altitudes = altitudes[visible]
+        azimuths = azimuths[visible]
+        
+        # Convert all visible points to pixel coordinates at once
+        pixel_x, pixel_y = self.sky_to_pixel_vec(altitudes, azimuths)
+        
+        return AnalemmaPoints(altitude=altitudes,
+                              azimuth=azimuths,
+                              pixel_x=pixel_x,
+                              pixel_y=pixel_y,
+                              dates=dates[visible])
+    
+    @staticmethod
+    def _stamp_dots(image: Image.Image,
+                    xs: np.ndarray,
+                    ys: np.ndarray,
+                    dot_size: int,
+                    color: Tuple[int, int, int],
+                    outline: Tuple[int, int, int] = (0, 0, 0)) -> Image.Image:
         """
-        Overlay the analemma curve onto the image.
+        Stamp outlined circular dots into an RGB image with one array write.
+        
+        The dot shape is rasterized once with ImageDraw.ellipse(), so the
+        result matches drawing each dot with ellipse(fill=..., outline=...)
+        in order, with later dots covering earlier ones.
         
         Parameters
         ----------
-        output_path : str
-            Path to save the output image
+        image : PIL.Image
+            RGB image to draw on
+        xs, ys : np.ndarray
+            Dot centre pixel coordinates
         dot_size : int
-            Size of dots marking sun positions
-        dot_color : tuple
-            RGB color for dots
-        line_color : tuple
-            RGB color for connecting line
-        line_width : int
-            Width of connecting line
-        show_dates : bool
-            Whether to label specific dates
-        date_interval : int
-            Days between date labels
+            Dot diameter in pixels
+        color : tuple
+            RGB fill colour
+        outline : tuple, optional
+            RGB outline colour (default: black)
+            
+        Returns
+        -------
+        PIL.Image
+            New image with the dots applied
+        """
+        r = dot_size // 2
+        template = Image.new('L', (2 * r + 1, 2 * r + 1), 0)
+        ImageDraw.Draw(template).ellipse([0, 0, 2 * r, 2 * r], fill=1, outline=2)
+        shape = np.asarray(template)
+        dy, dx = np.nonzero(shape)
+        palette = np.array([(0, 0, 0), color, outline], dtype=np.uint8)
+        
+        # Dot-major order so a later dot overwrites an earlier one
+        yy = (np.asarray(ys)[:, None] + (dy - r)).ravel()
+        xx = (np.asarray(xs)[:, None] + (dx - r)).ravel()
+        rgb = np.tile(palette[shape[dy, dx]], (len(xs), 1))
+        keep = (xx >= 0) & (xx < image.width) & (yy >= 0) & (yy < image.height)
+        
+        arr = np.array(image)
+        arr[yy[keep], xx[keep]] = rgb[keep]
+        return Image.fromarray(arr)
+    
+    def _build_overlay_image(self,
+                             analemma_points: AnalemmaPoints,
+                             dot_size: int = 10,
+                             dot_color: Tuple[int, int, int] = (255, 255, 0),
+                             line_color: Tuple[int, int, int] = (255, 200, 0),
+                             line_width: int = 2,
+                             show_dates: bool = True,
+                             date_interval: int = 30) -> Image.Image:
+        """
+        Render the analemma onto an in-memory copy of the image.
+        
+        Parameters
+        ----------
+        analemma_points : AnalemmaPoints
+            Points from generate_analemma_points()
+        dot_size, dot_color, line_color, line_width, show_dates, date_interval
+            Drawing options, as in overlay_analemma()
         
         Returns
         -------
         PIL.Image.Image
-            The output image with overlay
+            The image with overlay (not written to disk)
         """
-        # Generate analemma points
-        analemma_points = self.generate_analemma_points()
-        
         # Create a copy of the image to draw on
         output_image = self.image.copy()
         draw = ImageDraw.Draw(output_image)
         
-        # Try to load a font (fall back to default if not available)
-        try:
-            font = ImageFont.truetype("arial.ttf", 12)
-        except:
-            font = ImageFont.load_default()
+        font = _get_font("arial.ttf", 12)
         
         # Draw connecting line (only for visible points within image bounds)
-        line_points = [(p['pixel_x'], p['pixel_y']) for p in analemma_points
-                      if 0 <= p['pixel_x'] < self.image_width 
-                      and 0 <= p['pixel_y'] < self.image_height
-                      and p['altitude'] >= 0]
+        pixel_x = analemma_points.pixel_x
+        pixel_y = analemma_points.pixel_y
+        in_bounds = ((pixel_x >= 0) & (pixel_x < self.image_width) &
+                     (pixel_y >= 0) & (pixel_y < self.image_height))
+        line_mask = in_bounds & (analemma_points.altitude >= 0)
+        line_points = list(zip(pixel_x[line_mask].tolist(),
+                               pixel_y[line_mask].tolist()))
         
         if len(line_points) > 1:
             draw.line(line_points, fill=line_color, width=line_width)
         
-        # Draw dots for each position
-        for i, point in enumerate(analemma_points):
-            x, y = point['pixel_x'], point['pixel_y']
-            
-            # Skip if outside image bounds
-            if not (0 <= x < self.image_width and 0 <= y < self.image_height):
-                continue
-            
+        # Small dots are stamped straight into the pixel buffer in one pass;
+        # larger ones are drawn one ImageDraw ellipse at a time
+        stamp_dots = dot_size <= 3 and output_image.mode == 'RGB'
+        if stamp_dots:
+            output_image = self._stamp_dots(output_image, pixel_x[in_bounds],
+                                            pixel_y[in_bounds], dot_size, dot_color)
+            draw = ImageDraw.Draw(output_image)
+        
+        # Draw dots for each position inside the image bounds
+        for i, x, y, date in zip(np.flatnonzero(in_bounds).tolist(),
+                                 pixel_x[in_bounds].tolist(),
+                                 pixel_y[in_bounds].tolist(),
+                                 analemma_points.dates[in_bounds]):
             # Draw dot
-            bbox = [x - dot_size//2, y - dot_size//2,
-                   x + dot_size//2, y + dot_size//2]
-            draw.ellipse(bbox, fill=dot_color, outline=(0, 0, 0))
+            if not stamp_dots:
+                bbox = [x - dot_size//2, y - dot_size//2,
+                       x + dot_size//2, y + dot_size//2]
+                draw.ellipse(bbox, fill=dot_color, outline=(0, 0, 0))
             
             # Add date label
             if show_dates and i % date_interval == 0:
-                date_str = point['date'].strftime('%b %d')
+                date_str = date.strftime('%b %d')
                 draw.text((x + dot_size, y), date_str, 
                          fill=(255, 255, 255), font=font)
         
@@ -366,8 +571,52 @@ class ImageAnchorer:
                         f"throughout {self.anchor_datetime.year}")
         draw.text((10, 10), metadata_text, fill=(255, 255, 255), font=font)
         
+        return output_image
+    
+    def overlay_analemma(self,
+                        output_path: Optional[str],
+                        dot_size: int = 10,
+                        dot_color: Tuple[int, int, int] = (255, 255, 0),
+                        line_color: Tuple[int, int, int] = (255, 200, 0),
+                        line_width: int = 2,
+                        show_dates: bool = True,
+                        date_interval: int = 30) -> Dict:
+        """
+        Overlay the analemma curve onto the image.
+        
+        Parameters
+        ----------
+        output_path : str or None
+            Path to save the output image (None keeps it in memory only)
+        dot_size : int
+            Size of dots marking sun positions
+        dot_color : tuple
+            RGB color for dots
+        line_color : tuple
+            RGB color for connecting line
+        line_width : int
+            Width of connecting line
+        show_dates : bool
+            Whether to label specific dates
+        date_interval : int
+            Days between date labels
+        
+        Returns
+        -------
+        dict
+            Output image under 'image' plus drawing statistics
+        """
+        # Generate analemma points
+        analemma_points = self.generate_analemma_points()
+        
+        output_image = self._build_overlay_image(
+            analemma_points, dot_size=dot_size, dot_color=dot_color,
+            line_color=line_color, line_width=line_width,
+            show_dates=show_dates, date_interval=date_interval)
+        
         # Save output
-        output_image.save(output_path)
+        if output_path is not None:
+            output_image.save(output_path)
         
         # Return metadata
         total_points = 365
@@ -383,7 +632,7 @@ class ImageAnchorer:
             'sun_azimuth': self.anchor_data['azimuth']
         }
     
-    def create_composite_plot(self, output_path: str) -> plt.Figure:
+    def create_composite_plot(self, output_path: str) -> 'matplotlib.figure.Figure':
         """
         Create a composite visualization showing image and sky chart.
         
@@ -397,22 +646,21 @@ class ImageAnchorer:
         matplotlib.figure.Figure
             The created figure
         """
+        import matplotlib.pyplot as plt
+        
         analemma_points = self.generate_analemma_points()
         
         # Create figure with two subplots
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 7))
         
-        # Left: Original image with overlay
-        overlay_img = self.overlay_analemma(output_path + '_temp.png')
-        ax1.imshow(overlay_img)
+        # Left: Original image with overlay, rendered in memory
+        overlay_img = self._build_overlay_image(analemma_points)
+        ax1.imshow(np.asarray(overlay_img))
         ax1.axis('off')
         ax1.set_title('Image with Analemma Overlay', fontsize=14, fontweight='bold')
         
         # Right: Sky chart
-        altitudes = [p['altitude'] for p in analemma_points]
-        azimuths = [p['azimuth'] for p in analemma_points]
-        
-        scatter = ax2.scatter(azimuths, altitudes,
+        scatter = ax2.scatter(analemma_points.azimuth, analemma_points.altitude,
                             c=range(len(analemma_points)),
                             cmap='twilight',
                             s=50, alpha=0.7,
@@ -452,14 +700,18 @@ class ImageAnchorer:
         """
         analemma_points = self.generate_analemma_points()
         
-        altitudes = [p['altitude'] for p in analemma_points]
-        azimuths = [p['azimuth'] for p in analemma_points]
+        altitudes = analemma_points.altitude
+        azimuths = analemma_points.azimuth
+        
+        # Points are in date order, so unwrapping keeps an analemma that
+        # straddles north (0°/360°) from reporting a ~360° span
+        unwrapped_az = np.degrees(np.unwrap(np.radians(azimuths)))
         
         stats = {
-            'altitude_range': (min(altitudes), max(altitudes)),
-            'azimuth_range': (min(azimuths), max(azimuths)),
-            'altitude_span': max(altitudes) - min(altitudes),
-            'azimuth_span': max(azimuths) - min(azimuths),
+            'altitude_range': (altitudes.min(), altitudes.max()),
+            'azimuth_range': (azimuths.min(), azimuths.max()),
+            'altitude_span': np.ptp(altitudes),
+            'azimuth_span': np.ptp(unwrapped_az),
             'anchor_altitude': self.anchor_data['altitude'],
             'anchor_azimuth': self.anchor_data['azimuth'],
             'anchor_date': self.anchor_datetime,
@@ -1,8 +1,105 @@
 """Utility to parse metadata.txt files for automatic processing."""
 
+import functools
+import os
+import re
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Union
+
+IMAGE_EXTS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif'})
+
+# KEY=VALUE on a line that is not a comment; keys may contain spaces or
+# hyphens and are split at the first '=', like str.split('=', 1)
+_KV_RE = re.compile(rb'^(?![ \t]*#)[ \t]*([^=\r\n]*?)[ \t]*=[ \t]*(.*?)[ \t\r]*$',
+                    re.MULTILINE)
+_STOP_RE = re.compile(rb'--- (?:REFERENCE DATA|ADDITIONAL METADATA)')
+_FLOAT_KEYS = frozenset({'latitude', 'longitude', 'altitude_m',
+                         'focal_length_mm', 'sensor_width_mm', 'sensor_height_mm'})
+
+# __slots__ support in dataclasses needs Python 3.10+
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
+class Metadata:
+    """
+    Typed, read-only view of the dict returned by load_input_image().
+    
+    Get one with load_input_image(name, as_dataclass=True) to read fields as
+    attributes (metadata.latitude). metadata['latitude'] and
+    metadata.get('camera_make', default) look up fields and ``extra`` the
+    same way as the dict, and as_dict() returns a plain dict. Keys without
+    a dedicated field are kept in ``extra``.
+    """
+    image_file: str
+    datetime: datetime
+    latitude: float
+    longitude: float
+    focal_length_mm: float
+    sensor_width_mm: float
+    sensor_height_mm: float
+    altitude_m: Optional[float] = None
+    camera_make: Optional[str] = None
+    camera_model: Optional[str] = None
+    location_name: Optional[str] = None
+    image_path: Optional[str] = None
+    extra: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_dict(cls, metadata: Dict[str, Any]) -> 'Metadata':
+        """Build from a parse_metadata() dict, checking required keys."""
+        names = {f.name for f in fields(cls)} - {'extra'}
+        required = ('image_file', 'datetime', 'latitude', 'longitude',
+                    'focal_length_mm', 'sensor_width_mm', 'sensor_height_mm')
+        missing = [key for key in required if key not in metadata]
+        if missing:
+            raise ValueError("Metadata is missing required keys: "
+                             + ", ".join(key.upper() for key in missing))
+        known = {k: v for k, v in metadata.items() if k in names}
+        extra = {k: v for k, v in metadata.items() if k not in names}
+        return cls(**known, extra=extra)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the metadata as a dict with only the keys that are set."""
+        result = {f.name: getattr(self, f.name) for f in fields(self)
+                  if f.name != 'extra' and getattr(self, f.name) is not None}
+        result.update(self.extra)
+        return result
+    
+    def __getitem__(self, key: str) -> Any:
+        # Only metadata keys are looked up, never methods or ``extra`` itself
+        if key != 'extra' and key in self.__dataclass_fields__:
+            value = getattr(self, key)
+        else:
+            value = self.extra.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse 'YYYY-MM-DD HH:MM:SS' by slicing, falling back to strptime."""
+    v = value
+    if (len(v) == 19 and v[4] == '-' and v[7] == '-' and v[10] == ' '
+            and v[13] == ':' and v[16] == ':'):
+        try:
+            return datetime(int(v[0:4]), int(v[5:7]), int(v[8:10]),
+                            int(v[11:13]), int(v[14:16]), int(v[17:19]))
+        except ValueError:
+            pass
+    # strptime gives the usual error message for malformed values
+    return datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
 
 
 def parse_metadata(metadata_path: str) -> Dict[str, Any]:
@@ -12,6 +109,9 @@ def parse_metadata(metadata_path: str) -> Dict[str, Any]:
     Only parses KEY=VALUE pairs before the separator line.
     Stops at: # --- REFERENCE DATA (NOT PARSED) ---
     
+    Results are cached by path, modification time and size, so repeat calls
+    for an unchanged file skip the read. Each call returns a fresh copy.
+    
     Parameters
     ----------
     metadata_path : str
@@ -25,39 +125,44 @@ def parse_metadata(metadata_path: str) -> Dict[str, Any]:
         - focal_length_mm, sensor_width_mm, sensor_height_mm
         - Optional: altitude_m, camera_make, camera_model, location_name
     """
+    resolved = os.path.realpath(metadata_path)
+    st = os.stat(resolved)
+    return dict(_parse_metadata_cached(resolved, st.st_mtime_ns, st.st_size))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_metadata_cached(metadata_path: str, mtime_ns: int,
+                           size: int) -> Dict[str, Any]:
+    """Parse a metadata file; mtime_ns and size only key the cache."""
     metadata = {}
     
-    with open(metadata_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            
-            # Stop at separator - don't parse reference data
-            if '--- REFERENCE DATA' in line or '--- ADDITIONAL METADATA' in line:
-                break
-            
-            # Skip comments and empty lines
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse KEY=VALUE
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip().lower()
-                value = value.strip()
-                
-                # Type conversion
-                if key in ['latitude', 'longitude', 'altitude_m', 
-                          'focal_length_mm', 'sensor_width_mm', 'sensor_height_mm']:
-                    metadata[key] = float(value)
-                elif key == 'datetime':
-                    metadata[key] = datetime.strptime(value, '%Y-%m-%d %H:%M:%S')
-                else:
-                    metadata[key] = value
+    with open(metadata_path, 'rb') as f:
+        data = f.read()
+    
+    # Stop at separator - don't decode or parse reference data
+    stop = _STOP_RE.search(data)
+    if stop:
+        # Cut at the start of the separator line
+        data = data[:data.rfind(b'\n', 0, stop.start()) + 1]
+    
+    # Parse KEY=VALUE lines (comments and blank lines never match)
+    for match in _KV_RE.finditer(data):
+        key = match.group(1).decode('utf-8', 'replace').strip().lower()
+        value = match.group(2).decode('utf-8', 'replace').strip()
+        
+        # Type conversion
+        if key in _FLOAT_KEYS:
+            metadata[key] = float(value)
+        elif key == 'datetime':
+            metadata[key] = _parse_datetime(value)
+        else:
+            metadata[key] = value
     
     return metadata
 
 
-def load_input_image(image_name: str) -> Dict[str, Any]:
+def load_input_image(image_name: str,
+                     as_dataclass: bool = False) -> Union[Dict[str, Any], Metadata]:
     """
     Load an input image and its metadata.
     
@@ -67,53 +172,56 @@ def load_input_image(image_name: str) -> Dict[str, Any]:
     ----------
     image_name : str
         Name of the image folder (e.g., 'hongkong', 'nigeria')
+    as_dataclass : bool
+        Return a frozen Metadata instead of a dict (default False). This
+        also checks that the required keys are present.
         
     Returns
     -------
-    dict
+    dict or Metadata
         Complete metadata including full image path
     """
-    base_path = Path('input_images') / image_name
-    metadata_file = base_path / 'metadata.txt'
-    
-    if not metadata_file.exists():
-        raise FileNotFoundError(f"Metadata file not found: {metadata_file}")
+    # Plain string paths; callers only ever see str
+    base_path = os.path.join('input_images', image_name)
+    metadata_file = os.path.join(base_path, 'metadata.txt')
     
-    metadata = parse_metadata(str(metadata_file))
+    try:
+        metadata = parse_metadata(metadata_file)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Metadata file not found: {metadata_file}") from None
     
     # Auto-detect image file if not specified in metadata
     image_file = metadata.get('image_file')
     
     if not image_file:
-        # Look for image files in the directory
-        image_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.tif']
-        image_files = []
-        
-        for ext in image_extensions:
-            image_files.extend(list(base_path.glob(f'*{ext}')))
-            image_files.extend(list(base_path.glob(f'*{ext.upper()}')))
+        # Look for image files in the directory with a single listing pass
+        # (extension match is case-insensitive)
+        with os.scandir(base_path) as it:
+            image_files = sorted(e.name for e in it
+                                 if e.is_file() and
+                                 os.path.splitext(e.name)[1].lower() in IMAGE_EXTS)
         
         if len(image_files) == 0:
             raise FileNotFoundError(f"No image file found in {base_path}")
         elif len(image_files) > 1:
             # Use the first one but warn
-            print(f"Warning: Multiple image files found in {base_path}, using {image_files[0].name}")
-            image_file = image_files[0].name
+            print(f"Warning: Multiple image files found in {base_path}, using {image_files[0]}")
+            image_file = image_files[0]
         else:
-            image_file = image_files[0].name
+            image_file = image_files[0]
         
         metadata['image_file'] = image_file
     
     # Add full image path
-    metadata['image_path'] = str(base_path / image_file)
+    metadata['image_path'] = os.path.join(base_path, image_file)
     
+    if as_dataclass:
+        return Metadata.from_dict(metadata)
     return metadata
 
 
 if __name__ == '__main__':
     # Test the parser
-    import sys
-    
     if len(sys.argv) > 1:
         image_name = sys.argv[1]
     else:
@@ -8,19 +8,43 @@ Create various visualizations of the analemma including:
 - Interactive plots with Plotly
 """
 
+import importlib.util
+import weakref
 import numpy as np
-import matplotlib.pyplot as plt
-from matplotlib.patches import Circle
-from typing import List, Dict, Optional, Tuple
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
+from .sky_mapper import SkyDataArray
+
+# matplotlib and plotly are slow to import, so they are loaded on first plot.
 # Optional plotly for interactive plots
-try:
-    import plotly.graph_objects as go
-    import plotly.express as px
-    PLOTLY_AVAILABLE = True
-except ImportError:
-    PLOTLY_AVAILABLE = False
+PLOTLY_AVAILABLE = importlib.util.find_spec("plotly") is not None
+
+
+def _to_soa(records: Union[List[Dict], SkyDataArray],
+            *keys: str) -> Dict[str, np.ndarray]:
+    """
+    Gather fields of a list of result dicts into one array per field.
+    
+    A SkyDataArray's columns are used directly. 'date' is returned as an
+    object array; all other fields as float64.
+    """
+    if isinstance(records, SkyDataArray):
+        return {
+            key: (records.date.astype(object) if key == 'date'
+                  else getattr(records, key).astype(np.float64, copy=False))
+            for key in keys
+        }
+    
+    n = len(records)
+    soa = {}
+    for key in keys:
+        if key == 'date':
+            soa[key] = np.array([d[key] for d in records], dtype=object)
+        else:
+            soa[key] = np.fromiter((d[key] for d in records),
+                                   dtype=np.float64, count=n)
+    return soa
 
 
 class AnalemmaPlotter:
@@ -35,35 +59,101 @@ class AnalemmaPlotter:
         Matplotlib style to use (default: 'seaborn-v0_8-darkgrid')
     figure_size : tuple, optional
         Default figure size (width, height) in inches
+    cache_figures : bool, optional
+        If True, plot_figure8() and plot_time_series() return the existing
+        figure when called again with the same data list. Lists are matched
+        by id() and length, so the caller must keep the list alive and not
+        mutate it in place (default: False)
+    close_after_save : bool, optional
+        If True, figures are closed in pyplot once written to save_path, so
+        batch runs do not keep every figure alive. The returned figure can
+        still be saved again but is no longer shown by show() (default: False)
     """
     
+    # Style most recently applied to matplotlib, shared by all plotters
+    _style_applied = None
+    
     def __init__(self, style: str = 'seaborn-v0_8-darkgrid', 
-                 figure_size: Tuple[int, int] = (10, 8)):
+                 figure_size: Tuple[int, int] = (10, 8),
+                 cache_figures: bool = False, close_after_save: bool = False):
         """Initialize the plotter with style preferences."""
         self.style = style
         self.figure_size = figure_size
+        self.cache_figures = cache_figures
+        self.close_after_save = close_after_save
+        self._fig_cache = weakref.WeakValueDictionary()
+        self._twilight_cache = {}
+    
+    def _pyplot(self):
+        """Import pyplot and apply the plot style once, on first use."""
+        import matplotlib.pyplot as plt
+        
+        if AnalemmaPlotter._style_applied != self.style:
+            # Try to set style, fall back to default if not available
+            for style in (self.style, 'seaborn-darkgrid'):
+                try:
+                    plt.style.use(style)
+                    break
+                except Exception:
+                    pass
+            AnalemmaPlotter._style_applied = self.style
+            
+            # Let Agg render long paths in chunks unless the user chose a size
+            if not plt.rcParams['agg.path.chunksize']:
+                plt.rcParams['agg.path.chunksize'] = 10000
+        
+        return plt
+    
+    def _day_colors(self, n: int) -> np.ndarray:
+        """
+        RGBA colors running through the 'twilight' colormap for n points.
         
-        # Try to set style, fall back to default if not available
-        try:
-            plt.style.use(style)
-        except:
-            try:
-                plt.style.use('seaborn-darkgrid')
-            except:
-                pass  # Use default matplotlib style
+        Computed once per n and shared, so scatter calls skip their own
+        normalize-and-colormap pass.
+        """
+        colors = self._twilight_cache.get(n)
+        if colors is None:
+            from matplotlib import colormaps
+            colors = colormaps['twilight'](np.linspace(0, 1, n))
+            colors.flags.writeable = False
+            self._twilight_cache[n] = colors
+        return colors
+    
+    @staticmethod
+    def _day_mappable(plt, n: int):
+        """Colorbar source matching _day_colors(n) (day index 0 to n-1)."""
+        return plt.cm.ScalarMappable(norm=plt.Normalize(0, max(n - 1, 1)),
+                                     cmap='twilight')
+    
+    def _cached_figure(self, plt, key: tuple, save_path: Optional[str]):
+        """Return a still-open cached figure for key (saving it if asked)."""
+        if not self.cache_figures:
+            return None
+        fig = self._fig_cache.get(key)
+        if fig is None or not plt.fignum_exists(fig.number):
+            return None
+        self._save(plt, fig, save_path)
+        return fig
+    
+    def _save(self, plt, fig, save_path: Optional[str]):
+        """Write fig to save_path, closing it afterwards if configured."""
+        if save_path:
+            fig.savefig(save_path, dpi=300, bbox_inches='tight')
+            if self.close_after_save:
+                plt.close(fig)
     
     def plot_analemma(self, sky_data: List[Dict], 
                      title: str = "Analemma - Sun's Path Over One Year",
                      show_dates: bool = True,
                      date_interval: int = 30,
-                     save_path: Optional[str] = None) -> plt.Figure:
+                     save_path: Optional[str] = None) -> 'matplotlib.figure.Figure':
         """
         Plot the analemma as seen in the sky (Altitude vs Azimuth).
         
         Parameters
         ----------
-        sky_data : list
-            List of dictionaries from SkyMapper.map_to_horizon()
+        sky_data : list or SkyDataArray
+            Output of SkyMapper.map_to_horizon() or map_to_horizon_soa()
         title : str
             Plot title
         show_dates : bool
@@ -78,32 +168,33 @@ class AnalemmaPlotter:
         matplotlib.figure.Figure
             The created figure
         """
+        plt = self._pyplot()
+        
         # Extract data
-        altitudes = [d['altitude'] for d in sky_data]
-        azimuths = [d['azimuth'] for d in sky_data]
-        dates = [d['date'] for d in sky_data]
+        soa = _to_soa(sky_data, 'altitude', 'azimuth', 'date')
+        altitudes, azimuths, dates = soa['altitude'], soa['azimuth'], soa['date']
         
         # Create figure
         fig, ax = plt.subplots(figsize=self.figure_size)
         
         # Plot the analemma curve
         scatter = ax.scatter(azimuths, altitudes, 
-                           c=range(len(sky_data)), 
-                           cmap='twilight',
+                           c=self._day_colors(len(sky_data)),
                            s=50, alpha=0.7, 
                            edgecolors='black', linewidth=0.5)
         
         # Add colorbar for day of year
-        cbar = plt.colorbar(scatter, ax=ax, label='Day of Year')
+        cbar = plt.colorbar(self._day_mappable(plt, len(sky_data)), ax=ax,
+                            alpha=0.7, label='Day of Year')
         
         # Annotate specific dates
         if show_dates:
-            for i, (az, alt, date) in enumerate(zip(azimuths, altitudes, dates)):
-                if i % date_interval == 0:
-                    ax.annotate(date.strftime('%b %d'),
-                              (az, alt),
-                              xytext=(5, 5), textcoords='offset points',
-                              fontsize=8, alpha=0.7)
+            step = slice(None, None, date_interval)
+            for az, alt, date in zip(azimuths[step], altitudes[step], dates[step]):
+                ax.annotate(date.strftime('%b %d'),
+                          (az, alt),
+                          xytext=(5, 5), textcoords='offset points',
+                          fontsize=8, alpha=0.7)
         
         # Formatting
         ax.set_xlabel('Azimuth (degrees)', fontsize=12)
@@ -111,11 +202,16 @@ class AnalemmaPlotter:
         ax.set_title(title, fontsize=14, fontweight='bold')
         ax.grid(True, alpha=0.3)
         
-        # Add compass directions
-        ax.axvline(0, color='gray', linestyle='--', alpha=0.3, linewidth=1)
-        ax.axvline(90, color='gray', linestyle='--', alpha=0.3, linewidth=1)
-        ax.axvline(180, color='gray', linestyle='--', alpha=0.3, linewidth=1)
-        ax.axvline(270, color='gray', linestyle='--', alpha=0.3, linewidth=1)
+        # Add compass directions as one collection of full-height lines
+        # (x in data coordinates, y in axes coordinates, like axvline)
+        from matplotlib.collections import LineCollection
+        compass_az = (0, 90, 180, 270)
+        ax.add_collection(LineCollection(
+            [[(x, 0), (x, 1)] for x in compass_az],
+            colors='gray', linestyles='--', alpha=0.3, linewidth=1,
+            transform=ax.get_xaxis_transform()), autolim=False)
+        ax.update_datalim([(x, ax.dataLim.y0) for x in compass_az], updatey=False)
+        ax.autoscale_view()
         
         ax.text(0, ax.get_ylim()[1], 'N', ha='center', va='bottom', fontsize=10)
         ax.text(90, ax.get_ylim()[1], 'E', ha='center', va='bottom', fontsize=10)
@@ -124,14 +220,13 @@ class AnalemmaPlotter:
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        self._save(plt, fig, save_path)
         
         return fig
     
     def plot_figure8(self, calc_data: List[Dict],
                     title: str = "Analemma Figure-8 (EoT vs Declination)",
-                    save_path: Optional[str] = None) -> plt.Figure:
+                    save_path: Optional[str] = None) -> 'matplotlib.figure.Figure':
         """
         Plot the classic figure-8 analemma (EoT vs Declination).
         
@@ -139,8 +234,9 @@ class AnalemmaPlotter:
         
         Parameters
         ----------
-        calc_data : list
-            List of dictionaries from AnalemmaCalculator.calculate_year()
+        calc_data : list or SkyDataArray
+            List of dictionaries from AnalemmaCalculator.calculate_year(),
+            or a SkyDataArray built from them
         title : str
             Plot title
         save_path : str, optional
@@ -151,22 +247,29 @@ class AnalemmaPlotter:
         matplotlib.figure.Figure
             The created figure
         """
+        plt = self._pyplot()
+        
+        cache_key = ('plot_figure8', id(calc_data), len(calc_data), title)
+        fig = self._cached_figure(plt, cache_key, save_path)
+        if fig is not None:
+            return fig
+        
         # Extract data
-        eot = [d['eot'] for d in calc_data]
-        declination = [d['declination'] for d in calc_data]
+        soa = _to_soa(calc_data, 'eot', 'declination')
+        eot, declination = soa['eot'], soa['declination']
         
         # Create figure
         fig, ax = plt.subplots(figsize=self.figure_size)
         
         # Plot the figure-8
         scatter = ax.scatter(eot, declination,
-                           c=range(len(calc_data)),
-                           cmap='twilight',
+                           c=self._day_colors(len(calc_data)),
                            s=50, alpha=0.7,
                            edgecolors='black', linewidth=0.5)
         
         # Add colorbar
-        cbar = plt.colorbar(scatter, ax=ax, label='Day of Year')
+        cbar = plt.colorbar(self._day_mappable(plt, len(calc_data)), ax=ax,
+                            alpha=0.7, label='Day of Year')
         
         # Add reference lines
         ax.axhline(0, color='gray', linestyle='--', alpha=0.3, linewidth=1)
@@ -188,20 +291,23 @@ class AnalemmaPlotter:
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        self._save(plt, fig, save_path)
+        
+        if self.cache_figures:
+            self._fig_cache[cache_key] = fig
         
         return fig
     
     def plot_time_series(self, calc_data: List[Dict],
-                        save_path: Optional[str] = None) -> plt.Figure:
+                        save_path: Optional[str] = None) -> 'matplotlib.figure.Figure':
         """
         Plot declination and EoT as time series over the year.
         
         Parameters
         ----------
-        calc_data : list
-            List of dictionaries from AnalemmaCalculator.calculate_year()
+        calc_data : list or SkyDataArray
+            List of dictionaries from AnalemmaCalculator.calculate_year(),
+            or a SkyDataArray built from them
         save_path : str, optional
             If provided, save figure to this path
         
@@ -210,10 +316,16 @@ class AnalemmaPlotter:
         matplotlib.figure.Figure
             The created figure
         """
+        plt = self._pyplot()
+        
+        cache_key = ('plot_time_series', id(calc_data), len(calc_data))
+        fig = self._cached_figure(plt, cache_key, save_path)
+        if fig is not None:
+            return fig
+        
         # Extract data
-        days = [d['day_of_year'] for d in calc_data]
-        eot = [d['eot'] for d in calc_data]
-        declination = [d['declination'] for d in calc_data]
+        soa = _to_soa(calc_data, 'day_of_year', 'eot', 'declination')
+        days, eot, declination = soa['day_of_year'], soa['eot'], soa['declination']
         
         # Create figure with two subplots
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(12, 8))
@@ -248,21 +360,23 @@ class AnalemmaPlotter:
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        self._save(plt, fig, save_path)
+        
+        if self.cache_figures:
+            self._fig_cache[cache_key] = fig
         
         return fig
     
     def plot_sky_dome(self, sky_data: List[Dict],
                      title: str = "Analemma on Sky Dome",
-                     save_path: Optional[str] = None) -> plt.Figure:
+                     save_path: Optional[str] = None) -> 'matplotlib.figure.Figure':
         """
         Plot analemma on a polar sky dome projection.
         
         Parameters
         ----------
-        sky_data : list
-            List of dictionaries from SkyMapper.map_to_horizon()
+        sky_data : list or SkyDataArray
+            Output of SkyMapper.map_to_horizon() or map_to_horizon_soa()
         title : str
             Plot title
         save_path : str, optional
@@ -273,14 +387,16 @@ class AnalemmaPlotter:
         matplotlib.figure.Figure
             The created figure
         """
+        plt = self._pyplot()
+        
         # Extract data
-        altitudes = np.array([d['altitude'] for d in sky_data])
-        azimuths = np.array([d['azimuth'] for d in sky_data])
+        soa = _to_soa(sky_data, 'altitude', 'azimuth')
+        altitudes, azimuths = soa['altitude'], soa['azimuth']
         
         # Convert to polar coordinates (altitude becomes radius from edge)
         # Altitude 0° = edge (r=90), Altitude 90° = center (r=0)
-        r = 90 - altitudes
-        theta = np.radians(azimuths)
+        r = 90.0 - altitudes
+        theta = np.deg2rad(azimuths)
         
         # Create polar plot
         fig, ax = plt.subplots(figsize=self.figure_size, 
@@ -288,8 +404,7 @@ class AnalemmaPlotter:
         
         # Plot analemma
         scatter = ax.scatter(theta, r,
-                           c=range(len(sky_data)),
-                           cmap='twilight',
+                           c=self._day_colors(len(sky_data)),
                            s=50, alpha=0.7,
                            edgecolors='black', linewidth=0.5)
         
@@ -302,24 +417,24 @@ class AnalemmaPlotter:
         ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
         
         # Add colorbar
-        cbar = plt.colorbar(scatter, ax=ax, pad=0.1, label='Day of Year')
+        cbar = plt.colorbar(self._day_mappable(plt, len(sky_data)), ax=ax,
+                            pad=0.1, alpha=0.7, label='Day of Year')
         
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        self._save(plt, fig, save_path)
         
         return fig
     
     def plot_interactive(self, sky_data: List[Dict],
-                        title: str = "Interactive Analemma") -> go.Figure:
+                        title: str = "Interactive Analemma") -> "go.Figure":
         """
         Create an interactive plotly visualization.
         
         Parameters
         ----------
-        sky_data : list
-            List of dictionaries from SkyMapper.map_to_horizon()
+        sky_data : list or SkyDataArray
+            Output of SkyMapper.map_to_horizon() or map_to_horizon_soa()
         title : str
             Plot title
         
@@ -328,15 +443,17 @@ class AnalemmaPlotter:
         plotly.graph_objects.Figure
             Interactive plotly figure
         """
-        if not PLOTLY_AVAILABLE:
+        try:
+            import plotly.graph_objects as go
+        except ImportError:
             raise RuntimeError("Interactive plots require plotly. "
                              "Install with: pip install plotly")
         
         # Extract data
-        altitudes = [d['altitude'] for d in sky_data]
-        azimuths = [d['azimuth'] for d in sky_data]
-        dates = [d['date'].strftime('%Y-%m-%d') for d in sky_data]
-        days = [d['day_of_year'] for d in sky_data]
+        soa = _to_soa(sky_data, 'altitude', 'azimuth', 'day_of_year', 'date')
+        altitudes, azimuths, days = soa['altitude'], soa['azimuth'], soa['day_of_year']
+        # date().isoformat() gives the same 'YYYY-MM-DD' ~4x faster than strftime
+        dates = [d.date().isoformat() for d in soa['date']]
         
         # Create interactive scatter plot
         fig = go.Figure()
@@ -380,7 +497,7 @@ class AnalemmaPlotter:
     
     def plot_comparison(self, approx_data: List[Dict], 
                        precise_data: List[Dict],
-                       save_path: Optional[str] = None) -> plt.Figure:
+                       save_path: Optional[str] = None) -> 'matplotlib.figure.Figure':
         """
         Compare approximate and high-precision calculations.
         
@@ -398,16 +515,20 @@ class AnalemmaPlotter:
         matplotlib.figure.Figure
             The created figure
         """
+        plt = self._pyplot()
+        
         # Extract data
-        days = [d['day_of_year'] for d in approx_data]
+        approx = _to_soa(approx_data, 'day_of_year', 'declination', 'eot')
+        precise = _to_soa(precise_data, 'declination', 'eot')
+        days = approx['day_of_year']
         
-        approx_dec = [d['declination'] for d in approx_data]
-        precise_dec = [d['declination'] for d in precise_data]
-        dec_diff = [abs(a - p) for a, p in zip(approx_dec, precise_dec)]
+        approx_dec = approx['declination']
+        precise_dec = precise['declination']
+        dec_diff = np.abs(approx_dec - precise_dec)
         
-        approx_eot = [d['eot'] for d in approx_data]
-        precise_eot = [d['eot'] for d in precise_data]
-        eot_diff = [abs(a - p) for a, p in zip(approx_eot, precise_eot)]
+        approx_eot = approx['eot']
+        precise_eot = precise['eot']
+        eot_diff = np.abs(approx_eot - precise_eot)
         
         # Create figure
         fig, axes = plt.subplots(2, 2, figsize=(14, 10))
@@ -446,17 +567,18 @@ class AnalemmaPlotter:
                     fontsize=14, fontweight='bold')
         plt.tight_layout()
         
-        if save_path:
-            plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        self._save(plt, fig, save_path)
         
         return fig
     
     @staticmethod
     def show():
         """Display all open matplotlib figures."""
+        import matplotlib.pyplot as plt
         plt.show()
     
-    @staticmethod
-    def close_all():
-        """Close all matplotlib figures."""
+    def close_all(self):
+        """Close all matplotlib figures and drop the cached ones."""
+        import matplotlib.pyplot as plt
         plt.close('all')
+        self._fig_cache.clear()
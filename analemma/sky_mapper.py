@@ -5,10 +5,132 @@ Transforms celestial coordinates (declination, equation of time) into
 local horizon coordinates (altitude, azimuth) for a specific observer location.
 """
 
+import functools
+import importlib.util
+import math
 import numpy as np
+from dataclasses import dataclass
 from typing import Dict, List, Tuple
 from datetime import datetime, timezone
 
+# Optional JIT compilation of the bulk alt/az kernel. Numba is slow to
+# import and compile, so it is only loaded when a caller opts in.
+NUMBA_AVAILABLE = importlib.util.find_spec("numba") is not None
+
+
+@functools.lru_cache(maxsize=None)
+def _altaz_numba():
+    """Build the Numba hour angle/altitude/azimuth kernel on first use."""
+    from numba import njit, prange
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(declination, eot, time_from_noon, sin_lat, cos_lat,
+               lon_correction, out_ha, out_alt, out_az):
+        """Hour angle, altitude and azimuth for each point in one fused pass."""
+        for i in prange(declination.shape[0]):
+            ha = time_from_noon[i] * 15 + eot[i] / 4.0 + lon_correction
+            dec_rad = math.radians(declination[i])
+            ha_rad = math.radians(ha)
+            sin_dec = math.sin(dec_rad)
+            cos_dec = math.cos(dec_rad)
+            cos_ha = math.cos(ha_rad)
+            
+            out_ha[i] = ha
+            sin_alt = max(-1.0, min(1.0, sin_lat * sin_dec + cos_lat * cos_dec * cos_ha))
+            out_alt[i] = math.degrees(math.asin(sin_alt))
+            az = math.degrees(math.atan2(cos_dec * math.sin(ha_rad),
+                                         cos_dec * cos_ha * sin_lat - sin_dec * cos_lat))
+            out_az[i] = (az + 180) % 360
+    
+    return kernel
+
+
+@dataclass
+class SkyDataArray:
+    """
+    Horizon-mapped solar positions stored as parallel arrays (one per result).
+    
+    Column-oriented counterpart of the list of dicts returned by
+    SkyMapper.map_to_horizon(); use to_records() where dicts are needed.
+    
+    Attributes
+    ----------
+    date : np.ndarray
+        Observation times as datetime64[us]
+    day_of_year : np.ndarray
+        Day of year (1-366)
+    declination : np.ndarray
+        Solar declination in degrees
+    eot : np.ndarray
+        Equation of time in minutes
+    altitude : np.ndarray
+        Solar altitude in degrees
+    azimuth : np.ndarray
+        Solar azimuth in degrees
+    hour_angle : np.ndarray
+        Hour angle in degrees
+    """
+    date: np.ndarray
+    day_of_year: np.ndarray
+    declination: np.ndarray
+    eot: np.ndarray
+    altitude: np.ndarray
+    azimuth: np.ndarray
+    hour_angle: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.altitude)
+    
+    def to_records(self) -> List[Dict]:
+        """
+        Convert to the list-of-dicts layout of SkyMapper.map_to_horizon().
+        
+        Returns
+        -------
+        list
+            One dictionary per result with datetime 'date' values
+        """
+        return [
+            {
+                'declination': declination,
+                'eot': eot,
+                'day_of_year': day_of_year,
+                'date': date,
+                'altitude': altitude,
+                'azimuth': azimuth,
+                'hour_angle': hour_angle
+            }
+            for date, day_of_year, declination, eot, altitude, azimuth, hour_angle
+            in zip(self.date.astype(object).tolist(), self.day_of_year.tolist(),
+                   self.declination.tolist(), self.eot.tolist(),
+                   self.altitude.tolist(), self.azimuth.tolist(),
+                   self.hour_angle.tolist())
+        ]
+
+
+@functools.lru_cache(maxsize=128)
+def _annual_altaz_table(latitude: float, longitude: float, timezone_offset: float,
+                        year: int, hour: int, minute: int, days: int,
+                        mode: str, use_numba: bool = False) -> np.ndarray:
+    """
+    Solar (altitude, azimuth, hour_angle) at a fixed clock time over a year.
+    
+    Memoized on hashable inputs so repeated overlays for the same location
+    and time of day share one table. The returned (days, 3) array is
+    read-only.
+    """
+    from .calculator import AnalemmaCalculator
+    
+    calculator = AnalemmaCalculator(mode=mode, year=year)
+    mapper = SkyMapper(latitude, longitude, timezone_offset, use_numba=use_numba)
+    year_data = calculator.calculate_year(hour=hour, minute=minute, days=days)
+    coords = mapper.map_to_horizon_vec(year_data)
+    
+    table = np.column_stack((coords['altitude'], coords['azimuth'],
+                             coords['hour_angle']))
+    table.flags.writeable = False
+    return table
+
 
 class SkyMapper:
     """
@@ -26,13 +148,19 @@ class SkyMapper:
     timezone_offset : float, optional
         Timezone offset from UTC in hours (e.g., -6 for CST, -5 for EST)
         If None, will be calculated from longitude
+    use_numba : bool, optional
+        Use the Numba-compiled kernel in map_to_horizon_vec() when numba
+        is installed. Only worthwhile for very large batches: JIT warm-up
+        costs far more than the NumPy path on a year of points
+        (default: False)
     """
     
     def __init__(self, latitude: float, longitude: float, 
-                 timezone_offset: float = None):
+                 timezone_offset: float = None, use_numba: bool = False):
         """Initialize sky mapper with observer location."""
         self.latitude = latitude
         self.longitude = longitude
+        self.use_numba = use_numba and NUMBA_AVAILABLE
         
         # Calculate timezone offset from longitude if not provided
         # Standard time zones are roughly 15° apart (360°/24h = 15°/h)
@@ -42,7 +170,15 @@ class SkyMapper:
             self.timezone_offset = timezone_offset
         
         # Convert latitude to radians for calculations
-        self.latitude_rad = np.radians(latitude)
+        self.latitude_rad = math.radians(latitude)
+        
+        # Location-dependent terms reused by every calculation
+        self._sin_lat = math.sin(self.latitude_rad)
+        self._cos_lat = math.cos(self.latitude_rad)
+        self._tan_lat = math.tan(self.latitude_rad)
+        self._tz_meridian = self.timezone_offset * 15
+        self._lon_correction = self.longitude - self._tz_meridian
+        self._noon_offset_min = 12 * 60 + self._lon_correction * 4  # 4 min/deg
     
     def equation_of_time_to_hour_angle(self, eot_minutes: float, 
                                        hour: int, minute: int,
@@ -69,9 +205,6 @@ class SkyMapper:
         float
             Hour angle in degrees
         """
-        if longitude is None:
-            longitude = self.longitude
-        
         # Calculate time difference from local noon (12:00)
         time_from_noon = (hour - 12) + (minute / 60.0)
         
@@ -83,8 +216,10 @@ class SkyMapper:
         eot_degrees = eot_minutes / 4.0
         
         # Apply longitude correction relative to timezone meridian
-        timezone_meridian = self.timezone_offset * 15
-        longitude_correction = longitude - timezone_meridian
+        if longitude is None:
+            longitude_correction = self._lon_correction
+        else:
+            longitude_correction = longitude - self._tz_meridian
         
         # Total hour angle
         hour_angle = hour_angle_from_time + eot_degrees + longitude_correction
@@ -116,20 +251,21 @@ class SkyMapper:
             Solar altitude in degrees above horizon
         """
         # Convert to radians
-        dec_rad = np.radians(declination)
-        ha_rad = np.radians(hour_angle)
+        dec_rad = math.radians(declination)
+        ha_rad = math.radians(hour_angle)
         
         # Spherical law of cosines
-        sin_altitude = (np.sin(self.latitude_rad) * np.sin(dec_rad) + 
-                       np.cos(self.latitude_rad) * np.cos(dec_rad) * np.cos(ha_rad))
+        sin_altitude = (self._sin_lat * math.sin(dec_rad) + 
+                       self._cos_lat * math.cos(dec_rad) * math.cos(ha_rad))
         
-        # Convert back to degrees
-        altitude = np.degrees(np.arcsin(sin_altitude))
+        # Convert back to degrees (clamped: rounding can step just past ±1,
+        # where math.asin raises instead of returning nan)
+        altitude = math.degrees(math.asin(max(-1.0, min(1.0, sin_altitude))))
         
         return altitude
     
     def calculate_azimuth(self, declination: float, hour_angle: float, 
-                         altitude: float) -> float:
+                         altitude: float = None) -> float:
         """
         Calculate solar azimuth.
         
@@ -141,8 +277,8 @@ class SkyMapper:
             Solar declination in degrees
         hour_angle : float
             Hour angle in degrees
-        altitude : float
-            Solar altitude in degrees
+        altitude : float, optional
+            Unused; accepted for backward compatibility
         
         Returns
         -------
@@ -150,20 +286,23 @@ class SkyMapper:
             Solar azimuth in degrees (0-360)
         """
         # Convert to radians
-        dec_rad = np.radians(declination)
-        ha_rad = np.radians(hour_angle)
-        alt_rad = np.radians(altitude)
+        dec_rad = math.radians(declination)
+        ha_rad = math.radians(hour_angle)
+        
+        # Calculate azimuth using spherical trigonometry. Both components
+        # would be divided by cos(a), but atan2 is scale-invariant, so the
+        # division is skipped (it also misbehaves near the zenith)
+        cos_dec = math.cos(dec_rad)
         
-        # Calculate azimuth using spherical trigonometry
-        # cos(δ) * sin(H) / cos(a)
-        sin_azimuth = np.cos(dec_rad) * np.sin(ha_rad) / np.cos(alt_rad)
+        # cos(δ) * sin(H)
+        sin_azimuth = cos_dec * math.sin(ha_rad)
         
-        # cos(δ) * cos(H) * sin(φ) - sin(δ) * cos(φ) / cos(a)
-        cos_azimuth = ((np.cos(dec_rad) * np.cos(ha_rad) * np.sin(self.latitude_rad) - 
-                       np.sin(dec_rad) * np.cos(self.latitude_rad)) / np.cos(alt_rad))
+        # cos(δ) * cos(H) * sin(φ) - sin(δ) * cos(φ)
+        cos_azimuth = (cos_dec * math.cos(ha_rad) * self._sin_lat - 
+                       math.sin(dec_rad) * self._cos_lat)
         
         # Calculate azimuth using atan2 for proper quadrant
-        azimuth = np.degrees(np.arctan2(sin_azimuth, cos_azimuth))
+        azimuth = math.degrees(math.atan2(sin_azimuth, cos_azimuth))
         
         # Normalize to 0-360 range (measured from North, clockwise)
         # Our calculation gives azimuth from South, so we need to adjust
@@ -171,6 +310,28 @@ class SkyMapper:
         
         return azimuth
     
+    def _altitude_azimuth(self, declination: float,
+                          hour_angle: float) -> Tuple[float, float]:
+        """
+        Altitude and azimuth together, evaluating each sine/cosine once.
+        
+        Same formulas as calculate_altitude() and calculate_azimuth().
+        """
+        dec_rad = math.radians(declination)
+        ha_rad = math.radians(hour_angle)
+        sin_dec, cos_dec = math.sin(dec_rad), math.cos(dec_rad)
+        sin_ha, cos_ha = math.sin(ha_rad), math.cos(ha_rad)
+        
+        sin_altitude = self._sin_lat * sin_dec + self._cos_lat * cos_dec * cos_ha
+        altitude = math.degrees(math.asin(max(-1.0, min(1.0, sin_altitude))))
+        
+        azimuth = math.degrees(math.atan2(cos_dec * sin_ha,
+                                          cos_dec * cos_ha * self._sin_lat -
+                                          sin_dec * self._cos_lat))
+        azimuth = (azimuth + 180) % 360
+        
+        return altitude, azimuth
+    
     def calculate_max_altitude(self, declination: float) -> float:
         """
         Calculate maximum possible altitude (at meridian transit/solar noon).
@@ -221,18 +382,15 @@ class SkyMapper:
         )
         
         # Calculate altitude and azimuth
-        altitude = self.calculate_altitude(declination, hour_angle)
-        azimuth = self.calculate_azimuth(declination, hour_angle, altitude)
+        altitude, azimuth = self._altitude_azimuth(declination, hour_angle)
         
-        # Return enhanced result
-        result = calc_result.copy()
-        result.update({
+        # Return enhanced result (built in one step; input left untouched)
+        return {
+            **calc_result,
             'altitude': altitude,
             'azimuth': azimuth,
             'hour_angle': hour_angle
-        })
-        
-        return result
+        }
     
     def map_to_horizon(self, calc_results: List[Dict]) -> List[Dict]:
         """
@@ -248,7 +406,152 @@ class SkyMapper:
         list
             List of dictionaries with added altitude/azimuth data
         """
-        return [self.map_single_point(result) for result in calc_results]
+        coords = self.map_to_horizon_vec(calc_results)
+        
+        return [
+            {
+                **result,
+                'altitude': altitude,
+                'azimuth': azimuth,
+                'hour_angle': hour_angle
+            }
+            for result, hour_angle, altitude, azimuth in zip(
+                calc_results, coords['hour_angle'].tolist(),
+                coords['altitude'].tolist(), coords['azimuth'].tolist())
+        ]
+    
+    def map_to_horizon_vec(self, calc_results: List[Dict]) -> Dict[str, np.ndarray]:
+        """
+        Compute horizon coordinates for many calculation results at once.
+        
+        Same formulas as map_single_point(), evaluated on whole arrays.
+        
+        Parameters
+        ----------
+        calc_results : list
+            List of results from AnalemmaCalculator.calculate_year()
+        
+        Returns
+        -------
+        dict
+            Arrays 'hour_angle', 'altitude' and 'azimuth' in degrees,
+            one element per input result
+        """
+        n = len(calc_results)
+        declination = np.fromiter((r['declination'] for r in calc_results),
+                                  dtype=np.float64, count=n)
+        eot = np.fromiter((r['eot'] for r in calc_results),
+                          dtype=np.float64, count=n)
+        time_from_noon = np.fromiter(
+            ((r['date'].hour - 12) + r['date'].minute / 60.0 for r in calc_results),
+            dtype=np.float64, count=n)
+        
+        hour_angle, altitude, azimuth = self._horizon_arrays(
+            declination, eot, time_from_noon)
+        return {
+            'hour_angle': hour_angle,
+            'altitude': altitude,
+            'azimuth': azimuth
+        }
+    
+    def map_to_horizon_soa(self, calc_results: List[Dict]) -> SkyDataArray:
+        """
+        Map calculation results to horizon coordinates as parallel arrays.
+        
+        Parameters
+        ----------
+        calc_results : list
+            List of results from AnalemmaCalculator.calculate_year()
+        
+        Returns
+        -------
+        SkyDataArray
+            Input columns plus altitude, azimuth and hour angle
+        """
+        n = len(calc_results)
+        date = np.empty(n, dtype='datetime64[us]')
+        day_of_year = np.empty(n, dtype=np.int64)
+        declination = np.empty(n)
+        eot = np.empty(n)
+        time_from_noon = np.empty(n)
+        for i, r in enumerate(calc_results):
+            d = r['date']
+            date[i] = d
+            day_of_year[i] = r['day_of_year']
+            declination[i] = r['declination']
+            eot[i] = r['eot']
+            time_from_noon[i] = (d.hour - 12) + d.minute / 60.0
+        
+        hour_angle, altitude, azimuth = self._horizon_arrays(
+            declination, eot, time_from_noon)
+        return SkyDataArray(date=date, day_of_year=day_of_year,
+                            declination=declination, eot=eot,
+                            altitude=altitude, azimuth=azimuth,
+                            hour_angle=hour_angle)
+    
+    def _horizon_arrays(self, declination: np.ndarray, eot: np.ndarray,
+                        time_from_noon: np.ndarray
+                        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Hour angle, altitude and azimuth arrays in degrees."""
+        if self.use_numba:
+            n = len(declination)
+            hour_angle = np.empty(n)
+            altitude = np.empty(n)
+            azimuth = np.empty(n)
+            _altaz_numba()(declination, eot, time_from_noon, self._sin_lat,
+                           self._cos_lat, self._lon_correction,
+                           hour_angle, altitude, azimuth)
+            return hour_angle, altitude, azimuth
+        
+        # Hour angle: clock time, EoT and longitude correction (see
+        # equation_of_time_to_hour_angle)
+        hour_angle = time_from_noon * 15 + eot / 4.0 + self._lon_correction
+        
+        dec_rad = np.radians(declination)
+        ha_rad = np.radians(hour_angle)
+        sin_dec = np.sin(dec_rad)
+        cos_dec = np.cos(dec_rad)
+        cos_ha = np.cos(ha_rad)
+        
+        # Spherical law of cosines
+        sin_altitude = self._sin_lat * sin_dec + self._cos_lat * cos_dec * cos_ha
+        altitude = np.degrees(np.arcsin(np.clip(sin_altitude, -1.0, 1.0)))
+        
+        # arctan2 is scale-invariant, so the 1/cos(altitude) factor is omitted
+        y = cos_dec * np.sin(ha_rad)
+        x = cos_dec * cos_ha * self._sin_lat - sin_dec * self._cos_lat
+        azimuth = (np.degrees(np.arctan2(y, x)) + 180) % 360
+        
+        return hour_angle, altitude, azimuth
+    
+    def map_year(self, year: int, hour: int = 12, minute: int = 0,
+                 days: int = 365, mode: str = 'approximate') -> np.ndarray:
+        """
+        Horizon coordinates of the sun at one clock time on each day of a year.
+        
+        Results are cached per location, timezone, year, clock time and
+        calculation mode.
+        
+        Parameters
+        ----------
+        year : int
+            Year to calculate
+        hour, minute : int
+            Local clock time of each observation
+        days : int
+            Number of days starting January 1st (default: 365)
+        mode : str
+            AnalemmaCalculator mode (default: 'approximate')
+        
+        Returns
+        -------
+        np.ndarray
+            Read-only (days, 3) array of altitude, azimuth and hour angle
+            in degrees
+        """
+        return _annual_altaz_table(self.latitude, self.longitude,
+                                   self.timezone_offset, year, hour, minute,
+                                   days, mode, self.use_numba)
     
     def get_solar_noon_time(self, eot_minutes: float) -> Tuple[int, int]:
         """
@@ -265,23 +568,13 @@ class SkyMapper:
             (hour, minute) of solar noon in local time
         """
         # Solar noon is displaced from 12:00 by the equation of time
-        # and longitude correction
-        
-        # Longitude correction
-        timezone_meridian = self.timezone_offset * 15
-        longitude_correction_deg = self.longitude - timezone_meridian
-        longitude_correction_min = longitude_correction_deg * 4  # 4 min per degree
-        
-        # Total correction
-        total_correction_min = eot_minutes + longitude_correction_min
+        # and longitude correction (the latter fixed per instance)
+        noon_minutes = eot_minutes + self._noon_offset_min
         
-        # Apply to noon
-        noon_minutes = 12 * 60 + total_correction_min
+        # floor() keeps the old floor-division semantics for negative values
+        hour, minute = divmod(math.floor(noon_minutes), 60)
         
-        hour = int(noon_minutes // 60) % 24
-        minute = int(noon_minutes % 60)
-        
-        return (hour, minute)
+        return (hour % 24, minute)
     
     def get_sunrise_sunset_approx(self, declination: float) -> Tuple[float, float]:
         """
@@ -303,20 +596,46 @@ class SkyMapper:
         # At sunrise/sunset, altitude = 0
         # cos(H) = -tan(φ) * tan(δ)
         
-        dec_rad = np.radians(declination)
+        dec_rad = math.radians(declination)
         
-        cos_h = -np.tan(self.latitude_rad) * np.tan(dec_rad)
+        cos_h = -self._tan_lat * math.tan(dec_rad)
         
         # Check if sun rises/sets (doesn't at extreme latitudes during solstices)
         if abs(cos_h) > 1:
             return (None, None)  # Polar day or polar night
         
-        h_rad = np.arccos(cos_h)
-        h_deg = np.degrees(h_rad)
+        h_rad = math.acos(cos_h)
+        h_deg = math.degrees(h_rad)
         
         # Sunrise is at -H, sunset at +H (hour angle measured from noon)
         return (-h_deg, h_deg)
     
+    def get_sunrise_sunset_vec(self, declination: np.ndarray
+                               ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Approximate sunrise and sunset hour angles for many declinations.
+        
+        Vectorized get_sunrise_sunset_approx(); polar day and polar night
+        give NaN instead of None.
+        
+        Parameters
+        ----------
+        declination : np.ndarray
+            Solar declinations in degrees
+        
+        Returns
+        -------
+        tuple
+            (sunrise_hour_angle, sunset_hour_angle) arrays in degrees
+        """
+        cos_h = -self._tan_lat * np.tan(np.radians(declination))
+        
+        # Clip so arccos stays finite, then mask days without sunrise/sunset
+        h_deg = np.degrees(np.arccos(np.clip(cos_h, -1.0, 1.0)))
+        h_deg = np.where(np.abs(cos_h) > 1, np.nan, h_deg)
+        
+        return (-h_deg, h_deg)
+    
     def __repr__(self) -> str:
         return (f"SkyMapper(latitude={self.latitude}°, "
                 f"longitude={self.longitude}°, "
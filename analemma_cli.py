@@ -10,8 +10,18 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
-from analemma import AnalemmaCalculator, SkyMapper, AnalemmaPlotter
-from analemma.image_anchor import ImageAnchorer
+# The analemma package (NumPy, PIL, matplotlib) is imported inside
+# each command so that --help and argument errors return immediately
+
+
+def _fov_pair(value):
+    """Parse a "horizontal,vertical" field of view argument."""
+    try:
+        h_fov, v_fov = value.split(',')
+        return float(h_fov), float(v_fov)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f'expected "horizontal,vertical" in degrees, got {value!r}')
 
 
 def cmd_calculate(args):
@@ -22,35 +32,38 @@ def cmd_calculate(args):
     print(f"Mode: {args.mode}")
     print()
     
+    from analemma import AnalemmaCalculator, SkyMapper
+    
     # Initialize components
     calculator = AnalemmaCalculator(mode=args.mode, year=args.year)
     sky_mapper = SkyMapper(args.latitude, args.longitude)
     
     # Calculate
     calc_data = calculator.calculate_year(hour=args.hour, minute=args.minute)
-    sky_data = sky_mapper.map_to_horizon(calc_data)
+    sky = sky_mapper.map_to_horizon_soa(calc_data)
     
     # Print summary statistics
-    altitudes = [d['altitude'] for d in sky_data]
-    azimuths = [d['azimuth'] for d in sky_data]
+    alt_min, alt_max = sky.altitude.min(), sky.altitude.max()
+    az_min, az_max = sky.azimuth.min(), sky.azimuth.max()
     
     print("Analemma Statistics:")
-    print(f"  Altitude range: {min(altitudes):.2f}° to {max(altitudes):.2f}°")
-    print(f"  Azimuth range: {min(azimuths):.2f}° to {max(azimuths):.2f}°")
-    print(f"  Angular size: {max(altitudes)-min(altitudes):.2f}° × {max(azimuths)-min(azimuths):.2f}°")
+    print(f"  Altitude range: {alt_min:.2f}° to {alt_max:.2f}°")
+    print(f"  Azimuth range: {az_min:.2f}° to {az_max:.2f}°")
+    print(f"  Angular size: {alt_max-alt_min:.2f}° × {az_max-az_min:.2f}°")
     print()
     
     # Create visualizations if requested
     if args.plot:
         print("Creating visualizations...")
-        plotter = AnalemmaPlotter()
+        from analemma import AnalemmaPlotter
+        plotter = AnalemmaPlotter(close_after_save=not args.show)
         
         output_dir = Path(args.output) if args.output else Path(".")
         output_dir.mkdir(exist_ok=True)
         
         # Sky chart
         plotter.plot_analemma(
-            sky_data,
+            sky,
             title=f"Analemma at {args.latitude}°, {args.longitude}° ({args.hour:02d}:{args.minute:02d})",
             save_path=str(output_dir / "analemma_sky.png")
         )
@@ -80,6 +93,9 @@ def cmd_compare(args):
     print(f"Year: {args.year}")
     print()
     
+    import numpy as np
+    from analemma import AnalemmaCalculator
+    
     try:
         # Initialize both calculators
         calc_approx = AnalemmaCalculator(mode='approximate', year=args.year)
@@ -89,24 +105,28 @@ def cmd_compare(args):
         approx_data = calc_approx.calculate_year(hour=12, minute=0)
         precise_data = calc_precise.calculate_year(hour=12, minute=0)
         
-        # Compute differences
-        dec_diffs = [abs(a['declination'] - p['declination']) 
-                    for a, p in zip(approx_data, precise_data)]
-        eot_diffs = [abs(a['eot'] - p['eot']) 
-                    for a, p in zip(approx_data, precise_data)]
+        # Compute differences on whole columns
+        n = len(approx_data)
+        dec_diffs = np.abs(
+            np.fromiter((d['declination'] for d in approx_data), np.float64, n) -
+            np.fromiter((d['declination'] for d in precise_data), np.float64, n))
+        eot_diffs = np.abs(
+            np.fromiter((d['eot'] for d in approx_data), np.float64, n) -
+            np.fromiter((d['eot'] for d in precise_data), np.float64, n))
         
         print("Declination differences:")
-        print(f"  Mean: {sum(dec_diffs)/len(dec_diffs):.4f}°")
-        print(f"  Max:  {max(dec_diffs):.4f}°")
+        print(f"  Mean: {dec_diffs.mean():.4f}°")
+        print(f"  Max:  {dec_diffs.max():.4f}°")
         
         print("\nEquation of Time differences:")
-        print(f"  Mean: {sum(eot_diffs)/len(eot_diffs):.4f} minutes")
-        print(f"  Max:  {max(eot_diffs):.4f} minutes")
+        print(f"  Mean: {eot_diffs.mean():.4f} minutes")
+        print(f"  Max:  {eot_diffs.max():.4f} minutes")
         print()
         
         # Create comparison plot if requested
         if args.plot:
-            plotter = AnalemmaPlotter()
+            from analemma import AnalemmaPlotter
+            plotter = AnalemmaPlotter(close_after_save=not args.show)
             output_dir = Path(args.output) if args.output else Path(".")
             output_dir.mkdir(exist_ok=True)
             
@@ -143,6 +163,8 @@ def cmd_anchor(args):
         print("Error: Invalid datetime format. Use ISO format: YYYY-MM-DD HH:MM")
         sys.exit(1)
     
+    from analemma.image_anchor import ImageAnchorer
+    
     # Initialize anchorer
     anchorer = ImageAnchorer(
         image_path=args.image,
@@ -160,7 +182,7 @@ def cmd_anchor(args):
             sensor_height_mm=args.sensor_height
         )
     elif args.fov:
-        h_fov, v_fov = map(float, args.fov.split(','))
+        h_fov, v_fov = args.fov
         print(f"Calibrating with FOV: {h_fov}° × {v_fov}°")
         anchorer.calibrate_from_field_of_view(h_fov, v_fov)
     else:
@@ -257,7 +279,7 @@ Examples:
                              help='Sensor width in mm (default: 36)')
     anchor_parser.add_argument('--sensor-height', type=float, default=24.0,
                              help='Sensor height in mm (default: 24)')
-    anchor_parser.add_argument('--fov',
+    anchor_parser.add_argument('--fov', type=_fov_pair,
                              help='Field of view as "horizontal,vertical" in degrees')
     anchor_parser.add_argument('--no-dates', action='store_true',
                              help='Do not show date labels')
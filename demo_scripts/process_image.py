@@ -2,11 +2,13 @@
 General Analemma Image Processing Script
 
 Automatically loads image metadata and generates analemma overlay + composite.
-Usage: python process_image.py <image_name>
-Example: python process_image.py hongkong
+Usage: python process_image.py <image_name> [<image_name> ...]
+Example: python process_image.py hongkong nigeria
 """
 
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -16,6 +18,34 @@ from analemma.metadata_parser import load_input_image
 from PIL import Image
 import matplotlib.pyplot as plt
 
+# Optional SIMD resampler for the chart resize (falls back to Pillow)
+try:
+    from pic_scale import resize as ps_resize, Resampling as PSResampling
+    PIC_SCALE_AVAILABLE = True
+except ImportError:
+    PIC_SCALE_AVAILABLE = False
+
+
+def render_sky_chart_png(latitude: float, longitude: float, year: int,
+                         hour: int, minute: int, title: str) -> bytes:
+    """Render the sky chart for a location and clock time as PNG bytes."""
+    calc = AnalemmaCalculator(mode='approximate', year=year)
+    mapper = SkyMapper(latitude=latitude, longitude=longitude)
+    plotter = AnalemmaPlotter()
+    
+    calc_data = calc.calculate_year(hour=hour, minute=minute)
+    sky_data = mapper.map_to_horizon(calc_data)
+    
+    # plot_analemma() already applies tight_layout, so savefig can skip the
+    # extra measuring render of bbox_inches='tight'. A lighter zlib level
+    # suits the mostly flat-colour chart.
+    fig = plotter.plot_analemma(sky_data, title=title)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='png', dpi=150, facecolor='white',
+                pil_kwargs={'compress_level': 3})
+    plt.close(fig)
+    return buffer.getvalue()
+
 
 def process_image(image_name: str):
     """Process an input image with automatic metadata loading."""
@@ -36,7 +66,7 @@ def process_image(image_name: str):
             for subdir in input_dir.iterdir():
                 if subdir.is_dir() and (subdir / 'metadata.txt').exists():
                     print(f"  - {subdir.name}")
-        return
+        raise
     
     print(f"  ✓ Image: {metadata['image_file']}")
     print(f"  ✓ Location: {metadata['latitude']:.4f}°, {metadata['longitude']:.4f}°")
@@ -66,7 +96,8 @@ def process_image(image_name: str):
     output_dir.mkdir(parents=True, exist_ok=True)
     
     overlay_path = output_dir / f'{image_name}_overlay.png'
-    result = anchorer.overlay_analemma(output_path=str(overlay_path))
+    result = anchorer.overlay_analemma(output_path=None)
+    result['image'].save(overlay_path, 'PNG', compress_level=1)
     
     print(f"  ✓ Sun detected at pixel: {anchorer.sun_pixel}")
     print(f"  ✓ Sun position: Alt={anchorer.anchor_data['altitude']:.1f}°, Az={anchorer.anchor_data['azimuth']:.1f}°")
@@ -74,35 +105,30 @@ def process_image(image_name: str):
     
     # Step 4: Generate sky chart
     print("\nStep 4: Generating sky chart...")
-    calc = AnalemmaCalculator(mode='approximate', year=metadata['datetime'].year)
-    mapper = SkyMapper(latitude=metadata['latitude'], longitude=metadata['longitude'])
-    plotter = AnalemmaPlotter()
-    
-    calc_data = calc.calculate_year(
-        hour=metadata['datetime'].hour,
-        minute=metadata['datetime'].minute
-    )
-    sky_data = mapper.map_to_horizon(calc_data)
-    
     location_name = metadata.get('location_name', f"{metadata['latitude']:.2f}°, {metadata['longitude']:.2f}°")
     time_str = metadata['datetime'].strftime('%H:%M')
     
-    fig = plotter.plot_analemma(sky_data, title=f'Analemma at {location_name} - {time_str}')
+    chart_png = render_sky_chart_png(
+        metadata['latitude'], metadata['longitude'], metadata['datetime'].year,
+        metadata['datetime'].hour, metadata['datetime'].minute,
+        f'Analemma at {location_name} - {time_str}'
+    )
     chart_path = output_dir / f'{image_name}_sky_chart.png'
-    fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-    plt.close()
+    chart_path.write_bytes(chart_png)
     print(f"  ✓ Sky chart saved")
     
     # Step 5: Create composite
     print("\nStep 5: Creating side-by-side composite...")
-    overlay_img = Image.open(overlay_path)
-    chart_img = Image.open(chart_path)
+    # Reuse the in-memory overlay and chart rather than re-reading the files
+    overlay_img = result['image']
+    chart_img = Image.open(io.BytesIO(chart_png))
     
     # Resize chart to match overlay height
-    chart_img = chart_img.resize(
-        (int(chart_img.width * overlay_img.height / chart_img.height), overlay_img.height),
-        Image.Resampling.LANCZOS
-    )
+    chart_size = (int(chart_img.width * overlay_img.height / chart_img.height), overlay_img.height)
+    if PIC_SCALE_AVAILABLE:
+        chart_img = ps_resize(chart_img.convert("RGB"), chart_size, PSResampling.LANCZOS, workers=0)
+    else:
+        chart_img = chart_img.resize(chart_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
     
     # Create composite
     composite = Image.new('RGB', (overlay_img.width + chart_img.width, overlay_img.height), 'white')
@@ -110,7 +136,8 @@ def process_image(image_name: str):
     composite.paste(chart_img, (overlay_img.width, 0))
     
     composite_path = output_dir / f'{image_name}_composite.png'
-    composite.save(composite_path)
+    # Photo content barely shrinks at higher zlib levels, so favour speed
+    composite.save(composite_path, 'PNG', compress_level=1)
     
     print(f"\n{'=' * 70}")
     print("✓ COMPLETE!")
@@ -122,10 +149,40 @@ def process_image(image_name: str):
     print(f"\nComposite size: {composite.size[0]}x{composite.size[1]} pixels\n")
 
 
+def process_images(image_names, workers=None):
+    """
+    Process several input images, one worker process per image.
+    
+    Every image is attempted; if any of them failed, a RuntimeError naming
+    them is raised once all of them have finished.
+    """
+    failed = []
+    if len(image_names) == 1 or workers == 1:
+        for image_name in image_names:
+            try:
+                process_image(image_name)
+            except Exception as e:
+                print(f"Error processing {image_name}: {e}")
+                failed.append(image_name)
+    else:
+        # Images are independent, so each one runs in its own process
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(process_image, name): name for name in image_names}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"Error processing {futures[future]}: {e}")
+                    failed.append(futures[future])
+    
+    if failed:
+        raise RuntimeError(f"Failed to process: {', '.join(sorted(failed))}")
+
+
 if __name__ == '__main__':
     if len(sys.argv) < 2:
-        print("Usage: python process_image.py <image_name>")
-        print("\nExample: python process_image.py hongkong")
+        print("Usage: python process_image.py <image_name> [<image_name> ...]")
+        print("\nExample: python process_image.py hongkong nigeria")
         print("\nAvailable images:")
         input_dir = Path('input_images')
         if input_dir.exists():
@@ -134,5 +191,4 @@ if __name__ == '__main__':
                     print(f"  - {subdir.name}")
         sys.exit(1)
     
-    image_name = sys.argv[1]
-    process_image(image_name)
+    process_images(sys.argv[1:])
@@ -12,7 +12,8 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from datetime import datetime
-from analemma import AnalemmaCalculator, SkyMapper, AnalemmaPlotter
+import numpy as np
+from analemma import AnalemmaCalculator, SkyMapper
 
 
 def print_header(text):
@@ -86,16 +87,17 @@ def main():
     # Step 4: Compute statistics
     print("\nStep 4: Computing analemma statistics...")
     try:
-        altitudes = [d['altitude'] for d in sky_data]
-        azimuths = [d['azimuth'] for d in sky_data]
+        n = len(sky_data)
+        altitudes = np.fromiter((d['altitude'] for d in sky_data), dtype=np.float64, count=n)
+        azimuths = np.fromiter((d['azimuth'] for d in sky_data), dtype=np.float64, count=n)
         
-        print(f"  Altitude range: {min(altitudes):.2f}° to {max(altitudes):.2f}°")
-        print(f"  Altitude span: {max(altitudes) - min(altitudes):.2f}°")
-        print(f"  Azimuth range: {min(azimuths):.2f}° to {max(azimuths):.2f}°")
-        print(f"  Azimuth span: {max(azimuths) - min(azimuths):.2f}°")
+        print(f"  Altitude range: {altitudes.min():.2f}° to {altitudes.max():.2f}°")
+        print(f"  Altitude span: {np.ptp(altitudes):.2f}°")
+        print(f"  Azimuth range: {azimuths.min():.2f}° to {azimuths.max():.2f}°")
+        print(f"  Azimuth span: {np.ptp(azimuths):.2f}°")
         
         # Verify south-facing (northern hemisphere)
-        avg_az = sum(azimuths) / len(azimuths)
+        avg_az = azimuths.mean()
         if 160 < avg_az < 200:
             print(f"  ✓ Sun correctly positioned to south (avg azimuth: {avg_az:.1f}°)")
         else:
@@ -107,6 +109,8 @@ def main():
     # Step 5: Create visualizations
     print("\nStep 5: Creating visualizations...")
     try:
+        # Plotting support is only loaded once the calculations are done
+        from analemma import AnalemmaPlotter
         plotter = AnalemmaPlotter()
         
         # Create plots
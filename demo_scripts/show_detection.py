@@ -6,7 +6,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from datetime import datetime
 from analemma.image_anchor import ImageAnchorer
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageFont
+
+# Label font, loaded once
+FONT = ImageFont.load_default()
 
 # Create anchorer
 anchorer = ImageAnchorer(
@@ -37,7 +40,7 @@ draw.line([(sun_x, sun_y - radius - 20), (sun_x, sun_y + radius + 20)], fill=(25
 # Add text
 draw.text((sun_x + radius + 30, sun_y), 
           f"Auto-detected\nSun Position\n({sun_x}, {sun_y})", 
-          fill=(255, 255, 0))
+          fill=(255, 255, 0), font=FONT)
 
 img.save("output/hongkong_detection.png")
 print("\nDetection visualization saved to: output/hongkong_detection.png")
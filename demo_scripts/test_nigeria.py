@@ -1,5 +1,6 @@
 """Generate Nigeria analemma composite."""
 
+import io
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -10,6 +11,13 @@ from analemma.image_anchor import ImageAnchorer
 from PIL import Image
 import matplotlib.pyplot as plt
 
+# Optional SIMD resampler for the chart resize (falls back to Pillow)
+try:
+    from pic_scale import resize as ps_resize, Resampling as PSResampling
+    PIC_SCALE_AVAILABLE = True
+except ImportError:
+    PIC_SCALE_AVAILABLE = False
+
 # Nigeria photo metadata
 image_path = "input_images/nigeria/nigeria_img.jpg"
 photo_datetime = datetime(2025, 1, 19, 17, 47, 17)
@@ -48,7 +56,8 @@ anchorer.calibrate_from_focal_length(
 # Generate overlay
 print("\nStep 2: Generating analemma overlay...")
 overlay_path = "output/nigeria_final.png"
-result = anchorer.overlay_analemma(output_path=overlay_path)
+result = anchorer.overlay_analemma(output_path=None)
+result['image'].save(overlay_path, 'PNG', compress_level=1)
 
 print(f"  ✓ Sun detected at pixel: {anchorer.sun_pixel}")
 print(f"  ✓ Sun position: Alt={anchorer.anchor_data['altitude']:.1f}°, Az={anchorer.anchor_data['azimuth']:.1f}°")
@@ -63,19 +72,31 @@ plotter = AnalemmaPlotter()
 calc_data = calc.calculate_year(hour=17, minute=47)
 sky_data = mapper.map_to_horizon(calc_data)
 
+# Render once to memory; the same bytes are written out and reused for the
+# composite. plot_analemma() already applies tight_layout.
 fig = plotter.plot_analemma(sky_data, title='Nigeria Analemma - 5:47 PM')
+buffer = io.BytesIO()
+fig.savefig(buffer, format='png', dpi=150, facecolor='white',
+            pil_kwargs={'compress_level': 3})
+plt.close(fig)
+chart_png = buffer.getvalue()
+
 chart_path = "output/nigeria_sky_chart.png"
-fig.savefig(chart_path, dpi=150, bbox_inches='tight', facecolor='white')
-plt.close()
+Path(chart_path).write_bytes(chart_png)
 print(f"  ✓ Sky chart saved")
 
 # Step 4: Create composite
 print("\nStep 4: Creating side-by-side composite...")
-overlay = Image.open(overlay_path)
-chart = Image.open(chart_path)
+# Reuse the in-memory overlay and chart rather than re-reading the files
+overlay = result['image']
+chart = Image.open(io.BytesIO(chart_png))
 
 # Resize chart to match overlay height
-chart = chart.resize((int(chart.width * overlay.height / chart.height), overlay.height), Image.Resampling.LANCZOS)
+chart_size = (int(chart.width * overlay.height / chart.height), overlay.height)
+if PIC_SCALE_AVAILABLE:
+    chart = ps_resize(chart.convert("RGB"), chart_size, PSResampling.LANCZOS, workers=0)
+else:
+    chart = chart.resize(chart_size, Image.Resampling.LANCZOS, reducing_gap=3.0)
 
 # Create composite
 composite = Image.new('RGB', (overlay.width + chart.width, overlay.height), 'white')
@@ -83,7 +104,8 @@ composite.paste(overlay, (0, 0))
 composite.paste(chart, (overlay.width, 0))
 
 composite_path = "output/nigeria_composite.png"
-composite.save(composite_path)
+# Photo content barely shrinks at higher zlib levels, so favour speed
+composite.save(composite_path, 'PNG', compress_level=1)
 
 print(f"\n{'=' * 70}")
 print("✓ COMPLETE!")
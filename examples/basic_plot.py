@@ -6,7 +6,7 @@ and visualize the analemma for a specific location.
 """
 
 from datetime import datetime
-from analemma import AnalemmaCalculator, SkyMapper, AnalemmaPlotter
+from analemma import AnalemmaCalculator, SkyMapper
 
 
 def main():
@@ -63,6 +63,7 @@ def main():
     
     # Step 4: Create visualizations
     print("\nStep 4: Creating visualizations...")
+    from analemma import AnalemmaPlotter
     plotter = AnalemmaPlotter()
     
     # Plot 1: Sky chart (Altitude vs Azimuth)
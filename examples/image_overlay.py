@@ -8,6 +8,7 @@ analemma onto a sky photograph.
 from datetime import datetime
 from PIL import Image, ImageDraw
 import numpy as np
+import math
 import sys
 import os
 
@@ -25,14 +26,14 @@ def create_dummy_sky_image(filename: str = "dummy_sky.png"):
     """
     # Create a blue gradient sky
     width, height = 1200, 800
-    image = Image.new('RGB', (width, height))
-    pixels = image.load()
     
-    for y in range(height):
-        # Gradient from light blue (top) to darker blue (bottom)
-        blue_value = int(135 + (y / height) * 100)
-        for x in range(width):
-            pixels[x, y] = (100, 150, blue_value)
+    # Gradient from light blue (top) to darker blue (bottom), one value per row
+    blue_values = (135 + (np.arange(height) / height) * 100).astype(np.uint8)
+    sky = np.empty((height, width, 3), dtype=np.uint8)
+    sky[..., 0] = 100
+    sky[..., 1] = 150
+    sky[..., 2] = blue_values[:, None]
+    image = Image.fromarray(sky, 'RGB')
     
     # Draw some clouds
     draw = ImageDraw.Draw(image)
@@ -104,8 +105,8 @@ def main():
         sensor_height_mm=sensor_height
     )
     
-    h_fov = 2 * np.degrees(np.arctan(sensor_width / (2 * focal_length)))
-    v_fov = 2 * np.degrees(np.arctan(sensor_height / (2 * focal_length)))
+    h_fov = 2 * math.degrees(math.atan(sensor_width / (2 * focal_length)))
+    v_fov = 2 * math.degrees(math.atan(sensor_height / (2 * focal_length)))
     
     print(f"  Focal length: {focal_length}mm")
     print(f"  Horizontal FOV: {h_fov:.1f}°")
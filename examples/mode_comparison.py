@@ -4,7 +4,9 @@ Mode Comparison Example
 Compare approximate vs high-precision calculation modes to validate accuracy.
 """
 
+import importlib.util
 from datetime import datetime
+import numpy as np
 from analemma import AnalemmaCalculator, SkyMapper, AnalemmaPlotter
 
 
@@ -16,12 +18,9 @@ def main():
     print("=" * 70)
     print()
     
-    # Check if astropy is available
-    try:
-        import astropy
-        astropy_available = True
-    except ImportError:
-        astropy_available = False
+    # Check if astropy is available (without importing it)
+    astropy_available = importlib.util.find_spec('astropy') is not None
+    if not astropy_available:
         print("⚠ Warning: Astropy not installed.")
         print("Install with: pip install astropy")
         print("\nRunning approximate mode only...\n")
@@ -56,24 +55,27 @@ def main():
         print("Statistical Comparison:")
         print("-" * 70)
         
-        dec_diffs = [abs(a['declination'] - p['declination']) 
-                    for a, p in zip(approx_data, precise_data)]
-        eot_diffs = [abs(a['eot'] - p['eot']) 
-                    for a, p in zip(approx_data, precise_data)]
+        n = len(approx_data)
+        dec_diffs = np.abs(
+            np.fromiter((d['declination'] for d in approx_data), np.float64, n) -
+            np.fromiter((d['declination'] for d in precise_data), np.float64, n))
+        eot_diffs = np.abs(
+            np.fromiter((d['eot'] for d in approx_data), np.float64, n) -
+            np.fromiter((d['eot'] for d in precise_data), np.float64, n))
         
         print(f"\nDeclination differences:")
-        print(f"  Mean: {sum(dec_diffs)/len(dec_diffs):.4f}°")
-        print(f"  Max:  {max(dec_diffs):.4f}°")
-        print(f"  Min:  {min(dec_diffs):.4f}°")
+        print(f"  Mean: {dec_diffs.mean():.4f}°")
+        print(f"  Max:  {dec_diffs.max():.4f}°")
+        print(f"  Min:  {dec_diffs.min():.4f}°")
         
         print(f"\nEquation of Time differences:")
-        print(f"  Mean: {sum(eot_diffs)/len(eot_diffs):.4f} minutes")
-        print(f"  Max:  {max(eot_diffs):.4f} minutes")
-        print(f"  Min:  {min(eot_diffs):.4f} minutes")
+        print(f"  Mean: {eot_diffs.mean():.4f} minutes")
+        print(f"  Max:  {eot_diffs.max():.4f} minutes")
+        print(f"  Min:  {eot_diffs.min():.4f} minutes")
         
         # Find worst-case days
-        max_dec_idx = dec_diffs.index(max(dec_diffs))
-        max_eot_idx = eot_diffs.index(max(eot_diffs))
+        max_dec_idx = int(dec_diffs.argmax())
+        max_eot_idx = int(eot_diffs.argmax())
         
         print(f"\nLargest declination difference:")
         print(f"  Day {approx_data[max_dec_idx]['day_of_year']} "
@@ -7,6 +7,7 @@ the figure-8 shape, checking for the south-culminating loop.
 """
 
 from datetime import datetime
+import numpy as np
 from analemma import AnalemmaCalculator, SkyMapper, AnalemmaPlotter
 
 
@@ -34,40 +35,42 @@ def main():
     # Calculate for noon (12:00 local time)
     print("Calculating analemma for noon observations...")
     calc_data = calculator.calculate_year(hour=12, minute=0)
-    sky_data = sky_mapper.map_to_horizon(calc_data)
+    sky_data = sky_mapper.map_to_horizon_soa(calc_data)
+    
+    def describe_day(i):
+        return f"day {sky_data.day_of_year[i]} ({sky_data.date[i].item().strftime('%b %d')})"
     
     # Find extreme points to verify figure-8 shape
-    altitudes = [d['altitude'] for d in sky_data]
-    max_alt_idx = altitudes.index(max(altitudes))
-    min_alt_idx = altitudes.index(min(altitudes))
+    altitudes = sky_data.altitude
+    max_alt_idx = altitudes.argmax()
+    min_alt_idx = altitudes.argmin()
+    alt_span = np.ptp(altitudes)
     
     print(f"\nAltitude range:")
-    print(f"  Maximum: {max(altitudes):.2f}° on day {sky_data[max_alt_idx]['day_of_year']} "
-          f"({sky_data[max_alt_idx]['date'].strftime('%b %d')})")
-    print(f"  Minimum: {min(altitudes):.2f}° on day {sky_data[min_alt_idx]['day_of_year']} "
-          f"({sky_data[min_alt_idx]['date'].strftime('%b %d')})")
-    print(f"  Span: {max(altitudes) - min(altitudes):.2f}°")
+    print(f"  Maximum: {altitudes[max_alt_idx]:.2f}° on {describe_day(max_alt_idx)}")
+    print(f"  Minimum: {altitudes[min_alt_idx]:.2f}° on {describe_day(min_alt_idx)}")
+    print(f"  Span: {alt_span:.2f}°")
     
     # Check azimuth variation
-    azimuths = [d['azimuth'] for d in sky_data]
+    azimuths = sky_data.azimuth
+    az_max = azimuths.max()
+    az_min = azimuths.min()
     print(f"\nAzimuth range:")
-    print(f"  Maximum: {max(azimuths):.2f}°")
-    print(f"  Minimum: {min(azimuths):.2f}°")
-    print(f"  Span: {max(azimuths) - min(azimuths):.2f}°")
+    print(f"  Maximum: {az_max:.2f}°")
+    print(f"  Minimum: {az_min:.2f}°")
+    print(f"  Span: {az_max - az_min:.2f}°")
     
     # Check equation of time extremes
-    eots = [d['eot'] for d in calc_data]
-    max_eot_idx = eots.index(max(eots))
-    min_eot_idx = eots.index(min(eots))
+    eots = sky_data.eot
+    max_eot_idx = eots.argmax()
+    min_eot_idx = eots.argmin()
     
     print(f"\nEquation of Time range:")
-    print(f"  Maximum: {max(eots):+.2f} min on day {calc_data[max_eot_idx]['day_of_year']} "
-          f"({calc_data[max_eot_idx]['date'].strftime('%b %d')})")
-    print(f"  Minimum: {min(eots):+.2f} min on day {calc_data[min_eot_idx]['day_of_year']} "
-          f"({calc_data[min_eot_idx]['date'].strftime('%b %d')})")
+    print(f"  Maximum: {eots[max_eot_idx]:+.2f} min on {describe_day(max_eot_idx)}")
+    print(f"  Minimum: {eots[min_eot_idx]:+.2f} min on {describe_day(min_eot_idx)}")
     
     # Verify south culmination (for Northern hemisphere, sun at noon should be to the south)
-    avg_azimuth = sum(azimuths) / len(azimuths)
+    avg_azimuth = azimuths.mean()
     print(f"\nAverage azimuth: {avg_azimuth:.2f}° ", end="")
     if 160 < avg_azimuth < 200:
         print("✓ (Correctly positioned to the South)")
@@ -99,9 +102,9 @@ def main():
     print("\nKey observations:")
     print("  • Figure-8 shape formed by axial tilt and orbital eccentricity")
     print("  • Sun culminates to the South (Northern hemisphere)")
-    print(f"  • Altitude varies by {max(altitudes) - min(altitudes):.1f}° "
+    print(f"  • Altitude varies by {alt_span:.1f}° "
           "(≈ twice Earth's obliquity)")
-    print(f"  • East-West variation of {max(azimuths) - min(azimuths):.2f}° "
+    print(f"  • East-West variation of {az_max - az_min:.2f}° "
           "(from Equation of Time)")
     print("\nOutput files:")
     print("  - uiuc_noon_analemma.png")
@@ -5,24 +5,29 @@ Tests the core physics calculations against known values.
 """
 
 import unittest
+from unittest import mock
 import sys
 import os
+import importlib.util
 from datetime import datetime
 import numpy as np
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from analemma.calculator import AnalemmaCalculator
+from analemma.calculator import AnalemmaCalculator, ASTROPY_AVAILABLE, NUMBA_AVAILABLE
 from analemma.sky_mapper import SkyMapper
 
+SCIPY_AVAILABLE = importlib.util.find_spec('scipy') is not None
+
 
 class TestAnalemmaCalculator(unittest.TestCase):
     """Test the AnalemmaCalculator class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.calc = AnalemmaCalculator(mode='approximate', year=2026)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.calc = AnalemmaCalculator(mode='approximate', year=2026)
     
     def test_initialization(self):
         """Test calculator initialization."""
@@ -42,25 +47,23 @@ class TestAnalemmaCalculator(unittest.TestCase):
     
     def test_declination_at_solstices(self):
         """Test that declination is ±23.45° at solstices."""
-        # Summer solstice (around day 172)
-        dec_summer = self.calc.calculate_declination_approximate(172)
-        self.assertAlmostEqual(dec_summer, 23.45, delta=1.0)
-        
-        # Winter solstice (around day 355)
-        dec_winter = self.calc.calculate_declination_approximate(355)
-        self.assertAlmostEqual(dec_winter, -23.45, delta=1.0)
+        # Summer (around day 172) and winter (around day 355) solstices
+        dec = self.calc.calculate_declination_approximate_vec(np.array([172, 355]))
+        np.testing.assert_allclose(dec, [23.45, -23.45], rtol=0, atol=1.0)
     
     def test_declination_range(self):
         """Test that declination stays within ±23.45°."""
-        for day in range(1, 366):
-            dec = self.calc.calculate_declination_approximate(day)
-            self.assertLessEqual(abs(dec), 23.5)
+        dec = np.abs([self.calc.calculate_declination_approximate(day)
+                      for day in range(1, 366)])
+        worst = int(dec.argmax())
+        self.assertLessEqual(dec[worst], 23.5, f"day {worst + 1}")
     
     def test_equation_of_time_range(self):
         """Test that EoT stays within reasonable bounds (-20 to +20 minutes)."""
-        for day in range(1, 366):
-            eot = self.calc.calculate_equation_of_time_approximate(day)
-            self.assertLessEqual(abs(eot), 20)
+        eot = np.abs([self.calc.calculate_equation_of_time_approximate(day)
+                      for day in range(1, 366)])
+        worst = int(eot.argmax())
+        self.assertLessEqual(eot[worst], 20, f"day {worst + 1}")
     
     def test_calculate_full_year(self):
         """Test calculating full year returns correct number of points."""
@@ -74,6 +77,62 @@ class TestAnalemmaCalculator(unittest.TestCase):
             self.assertIn('day_of_year', point)
             self.assertIn('date', point)
     
+    def test_vectorized_matches_scalar(self):
+        """Test that vectorized formulas agree with the scalar ones."""
+        days = np.arange(1, 366)
+        dec_vec = self.calc.calculate_declination_approximate_vec(days)
+        eot_vec = self.calc.calculate_equation_of_time_approximate_vec(days)
+        
+        for day in (1, 81, 172, 264, 355, 365):
+            self.assertAlmostEqual(
+                dec_vec[day - 1],
+                self.calc.calculate_declination_approximate(day), places=10)
+            self.assertAlmostEqual(
+                eot_vec[day - 1],
+                self.calc.calculate_equation_of_time_approximate(day), places=10)
+    
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test that the Numba kernel agrees with the NumPy path."""
+        _, dec_jit, eot_jit = AnalemmaCalculator._year_tables(2026, 365, True)
+        _, dec_np, eot_np = AnalemmaCalculator._year_tables(2026, 365, False)
+        np.testing.assert_allclose(dec_jit, dec_np, atol=1e-9)
+        np.testing.assert_allclose(eot_jit, eot_np, atol=1e-9)
+    
+    def test_default_uses_numpy_path(self):
+        """Test that the default calculator never touches the Numba kernel."""
+        calc = AnalemmaCalculator(mode='approximate', year=2031)
+        self.assertFalse(calc.use_numba)
+        with mock.patch('analemma.calculator._decl_eot_numba') as kernel:
+            calc.calculate_year()
+        kernel.assert_not_called()
+    
+    @unittest.skipUnless(ASTROPY_AVAILABLE and SCIPY_AVAILABLE,
+                         "astropy and scipy required")
+    def test_interpolated_high_precision(self):
+        """Test that spline-interpolated values track the full calculation."""
+        calc = AnalemmaCalculator(mode='high-precision', year=2026)
+        exact = calc.calculate_year(hour=12, minute=0)
+        interpolated = calc.calculate_year_interpolated(hour=12, minute=0)
+        self.assertEqual(len(interpolated), len(exact))
+        
+        for e, i in zip(exact, interpolated):
+            self.assertEqual(e['date'], i['date'])
+            self.assertAlmostEqual(e['declination'], i['declination'], delta=0.05)
+            self.assertAlmostEqual(e['eot'], i['eot'], delta=0.1)
+    
+    @unittest.skipUnless(ASTROPY_AVAILABLE and SCIPY_AVAILABLE,
+                         "astropy and scipy required")
+    def test_interpolated_short_ranges(self):
+        """Test that too few days for a spline fall back to exact values."""
+        calc = AnalemmaCalculator(mode='high-precision', year=2026)
+        for days in (1, 2, 5):
+            with self.subTest(days=days):
+                self.assertEqual(calc.calculate_year_interpolated(days=days, n_anchor=5),
+                                 calc.calculate_year(days=days))
+        with self.assertRaises(ValueError):
+            calc.calculate_year_interpolated(n_anchor=1)
+    
     def test_max_declination(self):
         """Test max declination getter."""
         max_dec, min_dec = self.calc.get_max_declination()
@@ -84,10 +143,11 @@ class TestAnalemmaCalculator(unittest.TestCase):
 class TestSkyMapper(unittest.TestCase):
     """Test the SkyMapper class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mapper = SkyMapper(latitude=40.1, longitude=-88.2)
-        self.calc = AnalemmaCalculator(mode='approximate', year=2026)
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by every test in the class."""
+        cls.mapper = SkyMapper(latitude=40.1, longitude=-88.2)
+        cls.calc = AnalemmaCalculator(mode='approximate', year=2026)
     
     def test_initialization(self):
         """Test sky mapper initialization."""
@@ -148,6 +208,62 @@ class TestSkyMapper(unittest.TestCase):
         self.assertIn('declination', sky_result)
         self.assertIn('eot', sky_result)
     
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_numba_matches_numpy(self):
+        """Test that the Numba alt/az kernel agrees with the NumPy path."""
+        data = self.calc.calculate_year(hour=15, minute=30)
+        jit = SkyMapper(40.1, -88.2, use_numba=True).map_to_horizon_vec(data)
+        ref = SkyMapper(40.1, -88.2, use_numba=False).map_to_horizon_vec(data)
+        for key in ('hour_angle', 'altitude', 'azimuth'):
+            np.testing.assert_allclose(jit[key], ref[key], atol=1e-9)
+    
+    def test_default_uses_numpy_path(self):
+        """Test that the default mapper never touches the Numba kernel."""
+        self.assertFalse(self.mapper.use_numba)
+        with mock.patch('analemma.sky_mapper._altaz_numba') as kernel:
+            self.mapper.map_to_horizon(self.calc.calculate_year(hour=8))
+            self.mapper.map_year(2031, hour=8)
+        kernel.assert_not_called()
+    
+    @unittest.skipUnless(NUMBA_AVAILABLE, "numba not installed")
+    def test_map_year_honours_use_numba(self):
+        """Test that map_year() passes the mapper's use_numba to its table."""
+        mapper = SkyMapper(40.1, -88.2, use_numba=True)
+        with mock.patch('analemma.sky_mapper._altaz_numba') as kernel:
+            mapper.map_year(2032, hour=8)
+        kernel.assert_called()
+    
+    def test_vectorized_altitude_at_zenith(self):
+        """Test that rounding just past sin(alt) = 1 gives 90°, not nan."""
+        mapper = SkyMapper(latitude=2.5, longitude=0.0, timezone_offset=0,
+                           use_numba=False)
+        point = {'declination': 2.5, 'eot': 0.0, 'day_of_year': 60,
+                 'date': datetime(2026, 3, 1, 12, 0)}
+        altitude = mapper.map_to_horizon_vec([point])['altitude']
+        self.assertEqual(altitude[0], mapper.map_single_point(point)['altitude'])
+        self.assertEqual(altitude[0], 90.0)
+    
+    def test_soa_matches_records(self):
+        """Test that the array layout round-trips to map_to_horizon() dicts."""
+        data = self.calc.calculate_year(hour=9, minute=45)
+        sky = self.mapper.map_to_horizon_soa(data)
+        self.assertEqual(len(sky), 365)
+        self.assertEqual(sky.to_records(), self.mapper.map_to_horizon(data))
+    
+    def test_sunrise_sunset_vec_matches_scalar(self):
+        """Test vectorized sunrise/sunset, including polar day and night."""
+        mapper = SkyMapper(latitude=70.0, longitude=0.0)
+        declinations = np.array([-23.0, -10.0, 0.0, 15.0, 23.0])
+        sunrise, sunset = mapper.get_sunrise_sunset_vec(declinations)
+        
+        for dec, rise, set_ in zip(declinations, sunrise, sunset):
+            expected_rise, expected_set = mapper.get_sunrise_sunset_approx(dec)
+            if expected_rise is None:
+                self.assertTrue(np.isnan(rise) and np.isnan(set_))
+            else:
+                self.assertAlmostEqual(rise, expected_rise, places=10)
+                self.assertAlmostEqual(set_, expected_set, places=10)
+    
     def test_altitude_positive_at_noon(self):
         """Test that altitude is positive (above horizon) at noon."""
         data = self.calc.calculate_year(hour=12, minute=0)
@@ -0,0 +1,117 @@
+"""
+Unit Tests for Image Anchoring
+
+Tests sun detection and overlay drawing on synthetic images.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+import numpy as np
+from PIL import Image, ImageDraw
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analemma.image_anchor import ImageAnchorer
+
+
+def _anchor_for(img_array: np.ndarray, **kwargs) -> ImageAnchorer:
+    """Build an anchorer (auto-detecting by default) from an RGB array."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'sky.png')
+        Image.fromarray(img_array).save(path, compress_level=1)
+        return ImageAnchorer(path, datetime(2026, 6, 21, 12, 0), 40.1, -88.2,
+                             **kwargs)
+
+
+class TestSunDetection(unittest.TestCase):
+    """Test automatic sun detection on large photos."""
+    
+    def setUp(self):
+        """Blank image just over the coarse-search pixel limit."""
+        self.img = np.zeros((2000, 2100, 3), np.uint8)
+        self.yy, self.xx = np.ogrid[:2000, :2100]
+    
+    def test_small_sun_matches_full_resolution(self):
+        """Test that the coarse search + refine window finds the same pixel."""
+        self.img[(self.xx - 1303) ** 2 + (self.yy - 611) ** 2 <= 12 ** 2] = 255
+        anchor = _anchor_for(self.img)
+        self.assertEqual(anchor.sun_pixel, ImageAnchorer._locate_sun(self.img))
+    
+    def test_large_flare_matches_full_resolution(self):
+        """Test that a blob wider than the refine window is not clipped."""
+        self.img[(self.xx - 700) ** 2 + (self.yy - 900) ** 2 <= 40 ** 2] = 255
+        self.img[890:910, 700:1300] = 255
+        anchor = _anchor_for(self.img)
+        self.assertEqual(anchor.sun_pixel, ImageAnchorer._locate_sun(self.img))
+
+
+
+class TestDotStamping(unittest.TestCase):
+    """Test the array-stamped overlay dots against ImageDraw."""
+    
+    def test_stamp_matches_ellipse(self):
+        """Test that stamped dots are pixel-identical to outlined ellipses."""
+        rng = np.random.default_rng(0)
+        base = Image.fromarray(rng.integers(0, 256, (40, 50, 3), dtype=np.uint8))
+        # Random dots (some past the edges) plus an overlapping run
+        xs = np.r_[rng.integers(-2, 52, 60), 10, 11, 12]
+        ys = np.r_[rng.integers(-2, 42, 60), 5, 5, 6]
+        
+        for dot_size in (1, 2, 3):
+            with self.subTest(dot_size=dot_size):
+                expected = base.copy()
+                draw = ImageDraw.Draw(expected)
+                half = dot_size // 2
+                for x, y in zip(xs.tolist(), ys.tolist()):
+                    draw.ellipse([x - half, y - half, x + half, y + half],
+                                 fill=(255, 255, 0), outline=(0, 0, 0))
+                
+                stamped = ImageAnchorer._stamp_dots(base, xs, ys, dot_size,
+                                                    (255, 255, 0))
+                np.testing.assert_array_equal(np.asarray(stamped),
+                                              np.asarray(expected))
+
+
+
+class TestAnchorUpdates(unittest.TestCase):
+    """Test that pixel mapping follows changes to the anchor."""
+    
+    def setUp(self):
+        self.anchor = _anchor_for(np.zeros((400, 600, 3), np.uint8),
+                                  sun_pixel=(300, 200))
+        self.anchor.calibrate_from_field_of_view(60.0, 40.0)
+    
+    def test_sun_pixel_change(self):
+        """Test that reassigning sun_pixel moves every converted point."""
+        before = self.anchor.generate_analemma_points()
+        single = self.anchor.sky_to_pixel(50.0, 170.0)
+        
+        self.anchor.sun_pixel = (310, 195)
+        after = self.anchor.generate_analemma_points()
+        self.assertEqual(self.anchor.sky_to_pixel(50.0, 170.0),
+                         (single[0] + 10, single[1] - 5))
+        np.testing.assert_array_equal(after.pixel_x, before.pixel_x + 10)
+        np.testing.assert_array_equal(after.pixel_y, before.pixel_y - 5)
+    
+    def test_anchor_data_change(self):
+        """Test that reassigning anchor_data is used by later conversions."""
+        self.anchor.generate_analemma_points()
+        data = dict(self.anchor.anchor_data)
+        data['altitude'] = 50.0
+        data['azimuth'] = 170.0
+        self.anchor.anchor_data = data
+        
+        self.assertEqual(self.anchor.sky_to_pixel(50.0, 170.0), (300, 200))
+        x, y = self.anchor.sky_to_pixel_vec(np.array([50.0]), np.array([170.0]))
+        self.assertEqual((x[0], y[0]), (300, 200))
+        points = self.anchor.generate_analemma_points()
+        expected_x, _ = self.anchor.sky_to_pixel_vec(points.altitude, points.azimuth)
+        np.testing.assert_array_equal(points.pixel_x, expected_x)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Unit Tests for Metadata Parsing
+
+Tests metadata.txt parsing and input image loading.
+"""
+
+import unittest
+import sys
+import os
+import tempfile
+from datetime import datetime
+
+# Add parent directory to path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analemma.metadata_parser import Metadata, load_input_image, parse_metadata
+
+SAMPLE_METADATA = """# Test Sky Photo - Metadata
+# Format: KEY=VALUE (parser reads only this section)
+
+# === REQUIRED METADATA ===
+DATETIME=2024-06-15 14:30:00
+LATITUDE=40.1
+LONGITUDE=-88.2
+FOCAL_LENGTH_MM=5.7
+SENSOR_WIDTH_MM=7.8
+SENSOR_HEIGHT_MM=5.8
+
+# === OPTIONAL METADATA ===
+ALTITUDE_M=200.0
+CAMERA_MAKE=Apple
+LOCATION_NAME=Urbana, IL
+
+# --- REFERENCE DATA (NOT PARSED) ---
+# LATITUDE=0.0
+"""
+
+# Lines the original line-by-line split('=', 1) parser handled: spaced and
+# hyphenated keys, '=' inside values, indented comments and CRLF endings
+EDGE_CASE_METADATA = (
+    "# Sample - Metadata\r\n"
+    "# COMMENTED_KEY=ignored\r\n"
+    "   # INDENTED_COMMENT = also ignored\r\n"
+    "\r\n"
+    "DATETIME=2024-06-15 14:30:00\r\n"
+    "  LATITUDE = 22.3193  \r\n"
+    "LONGITUDE=114.1694\r\n"
+    "CAMERA_MAKE=\r\n"
+    "Location Name = Harbour front\r\n"
+    "camera-model = Pixel 8\r\n"
+    "NOTES=exposure=1/4000 s\r\n"
+    "Mixed_Case_Key=Value With Spaces\r\n"
+    "no equals sign on this line\r\n"
+    "# --- ADDITIONAL METADATA ---\r\n"
+    "LATITUDE=0.0\r\n"
+)
+
+# parse_metadata() output of the original parser for EDGE_CASE_METADATA
+EDGE_CASE_EXPECTED = {
+    'datetime': datetime(2024, 6, 15, 14, 30),
+    'latitude': 22.3193,
+    'longitude': 114.1694,
+    'camera_make': '',
+    'location name': 'Harbour front',
+    'camera-model': 'Pixel 8',
+    'notes': 'exposure=1/4000 s',
+    'mixed_case_key': 'Value With Spaces',
+}
+
+
+class TestParseMetadata(unittest.TestCase):
+    """Test parse_metadata() against the original parser's output."""
+    
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, 'metadata.txt')
+    
+    def tearDown(self):
+        self._tmp.cleanup()
+    
+    def _write(self, text: str):
+        with open(self.path, 'w', newline='') as f:
+            f.write(text)
+    
+    def test_sample_round_trip(self):
+        """Test that the standard template parses to the expected types."""
+        self._write(SAMPLE_METADATA)
+        self.assertEqual(parse_metadata(self.path), {
+            'datetime': datetime(2024, 6, 15, 14, 30),
+            'latitude': 40.1,
+            'longitude': -88.2,
+            'focal_length_mm': 5.7,
+            'sensor_width_mm': 7.8,
+            'sensor_height_mm': 5.8,
+            'altitude_m': 200.0,
+            'camera_make': 'Apple',
+            'location_name': 'Urbana, IL',
+        })
+    
+    def test_edge_cases_match_original_parser(self):
+        """Test keys with spaces/hyphens, CRLF and comments."""
+        self._write(EDGE_CASE_METADATA)
+        result = parse_metadata(self.path)
+        self.assertEqual(result, EDGE_CASE_EXPECTED)
+        self.assertEqual(list(result), list(EDGE_CASE_EXPECTED))
+    
+    def test_cache_returns_fresh_copies(self):
+        """Test that cached results are copied and invalidated on change."""
+        self._write(SAMPLE_METADATA)
+        parse_metadata(self.path)['latitude'] = 0.0
+        self.assertEqual(parse_metadata(self.path)['latitude'], 40.1)
+        
+        self._write(SAMPLE_METADATA.replace('LATITUDE=40.1', 'LATITUDE=-33.86'))
+        self.assertEqual(parse_metadata(self.path)['latitude'], -33.86)
+
+
+class TestLoadInputImage(unittest.TestCase):
+    """Test load_input_image() and its Metadata return type."""
+    
+    def setUp(self):
+        """Create input_images/test with metadata and an image file."""
+        self._cwd = os.getcwd()
+        self._tmp = tempfile.TemporaryDirectory()
+        os.chdir(self._tmp.name)
+        os.makedirs(os.path.join('input_images', 'test'))
+        with open(os.path.join('input_images', 'test', 'metadata.txt'), 'w') as f:
+            f.write(SAMPLE_METADATA)
+        open(os.path.join('input_images', 'test', 'sky.jpg'), 'wb').close()
+    
+    def tearDown(self):
+        os.chdir(self._cwd)
+        self._tmp.cleanup()
+    
+    def test_returns_mutable_dict(self):
+        """Test that load_input_image() keeps its dict return value."""
+        metadata = load_input_image('test')
+        self.assertIsInstance(metadata, dict)
+        self.assertEqual(metadata['image_file'], 'sky.jpg')
+        self.assertEqual(metadata['image_path'],
+                         os.path.join('input_images', 'test', 'sky.jpg'))
+        self.assertEqual(metadata['datetime'], datetime(2024, 6, 15, 14, 30))
+        metadata['latitude'] = 0.0
+        self.assertEqual(dict(metadata.items())['latitude'], 0.0)
+    
+    def test_metadata_view(self):
+        """Test that as_dataclass=True matches the dict without exposing methods."""
+        metadata = load_input_image('test')
+        view = load_input_image('test', as_dataclass=True)
+        self.assertIsInstance(view, Metadata)
+        self.assertEqual(view.image_file, 'sky.jpg')
+        self.assertEqual(view.latitude, 40.1)
+        self.assertEqual(view['location_name'], 'Urbana, IL')
+        self.assertEqual(view.as_dict(), metadata)
+        for key in ('get', 'as_dict', 'from_dict', 'extra', 'camera_model'):
+            with self.subTest(key=key):
+                with self.assertRaises(KeyError):
+                    view[key]
+                self.assertNotIn(key, view)
+    
+    def test_metadata_view_requires_keys(self):
+        """Test that from_dict() names missing required keys."""
+        metadata = load_input_image('test')
+        del metadata['focal_length_mm']
+        with self.assertRaisesRegex(ValueError, 'FOCAL_LENGTH_MM'):
+            Metadata.from_dict(metadata)
+
+
+if __name__ == "__main__":
+    unittest.main()